@@ -2,8 +2,10 @@
 Configuration Loader - Loads and validates YAML environment configurations
 """
 
+import functools
+import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import yaml
 
 
@@ -12,6 +14,32 @@ class ConfigValidationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=8)
+def _scan_config_dir(config_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    List config filenames in a directory: sorted .yaml files, then sorted .yml files.
+
+    Cached per directory mtime, so repeated discovery skips the directory
+    scan until files are added, removed or renamed.
+
+    Args:
+        config_dir: Directory to scan
+        mtime_ns: Directory modification time (cache key only)
+
+    Returns:
+        Tuple of filenames
+    """
+    with os.scandir(config_dir) as it:
+        names = [entry.name for entry in it if entry.is_file()]
+    names.sort()
+    yaml_names = [
+        name for name in names
+        if name.endswith(".yaml") and name != "README.yaml"  # Skip README if it exists
+    ]
+    yml_names = [name for name in names if name.endswith(".yml")]
+    return tuple(yaml_names + yml_names)
+
+
 class ConfigLoader:
     """
     Loads and validates YAML environment configurations.
@@ -436,24 +464,18 @@ class ConfigLoader:
         """
         configs = []
 
-        # Find all .yaml and .yml files
-        for yaml_file in sorted(self.config_dir.glob("*.yaml")):
-            if yaml_file.name == "README.yaml":  # Skip README if it exists
-                continue
+        # Find all .yaml and .yml files (directory listing cached by mtime)
+        filenames = _scan_config_dir(
+            str(self.config_dir), self.config_dir.stat().st_mtime_ns
+        )
+        for filename in filenames:
             try:
-                config = self.load(yaml_file.name)
+                config = self.load(filename)
                 configs.append(config)
             except Exception as e:
-                print(f"WARNING: Failed to load {yaml_file.name}: {str(e)}")
+                print(f"WARNING: Failed to load {filename}: {str(e)}")
                 # Continue loading other files even if one fails
 
-        for yml_file in sorted(self.config_dir.glob("*.yml")):
-            try:
-                config = self.load(yml_file.name)
-                configs.append(config)
-            except Exception as e:
-                print(f"WARNING: Failed to load {yml_file.name}: {str(e)}")
-
         return configs
 
     def get_by_category(self, category: str) -> List[Dict[str, Any]]:
@@ -260,12 +260,12 @@ class SpotifyEngine:
             scope=scope,
         )
 
-        # Get access token (automatically handles OAuth via local server)
-        token_dict = oauth_object.get_access_token()
-        token = token_dict["access_token"]
+        # Get access token now (automatically handles OAuth via local server)
+        oauth_object.get_access_token()
 
-        # Create authenticated Spotify client
-        self.spotify_client = spotipy.Spotify(auth=token)
+        # Create authenticated Spotify client; the auth manager refreshes the
+        # token when it expires so a long-lived engine keeps working
+        self.spotify_client = spotipy.Spotify(auth_manager=oauth_object)
 
     def play_context(self, context_uri: Optional[str]) -> bool:
         """
@@ -0,0 +1,17 @@
+# spotify and wiz bulb settings, parsed once per process
+import configparser
+from functools import lru_cache
+from wizlight_pool import get_bulb
+
+
+@lru_cache(maxsize=None)
+def load_config():
+    # the two files use distinct keys, so one parser holds both
+    config = configparser.ConfigParser()
+    config.read([".spotify.ini", ".wizbulb.ini"])
+    return config
+
+
+def load_bulb_group(name):
+    # a new list on every call: the scripts shuffle their groups in place
+    return [get_bulb(ip) for ip in load_config()["DEFAULT"][name].split()]
@@ -2,12 +2,12 @@
 import playsound3
 import configparser
 import asyncio
-import time
 import random
 import spotipy
 import webbrowser
 from spotipy.oauth2 import SpotifyClientCredentials
-from pywizlight import wizlight, PilotBuilder, discovery
+from pywizlight import PilotBuilder, discovery
+from wizlight_pool import get_bulb
 
 green = 15
 blue = 15
@@ -16,90 +16,105 @@ flash_variance = 25
 scope = "ugc-image-upload user-read-playback-state user-modify-playback-state user-read-currently-playing app-remote-control streaming"
 playlist = "spotify:playlist:4iYXc8F4OogJCYqnb2a6Ia"
 sound_effect = "dooropen.wav"
-config = configparser.ConfigParser()
-config.read(".spotify.ini")
-username = config["DEFAULT"]["username"]
-spotify_id = config["DEFAULT"]["client_id"]
-spotify_secret = config["DEFAULT"]["client_secret"]
-redirectURI = config["DEFAULT"]["redirectURI"]
-oauth_object = spotipy.SpotifyOAuth(
-    client_id=spotify_id,
-    client_secret=spotify_secret,
-    redirect_uri=redirectURI,
-    scope=scope,
-)
-token_dict = oauth_object.get_access_token()
-token = token_dict["access_token"]
-spotify = spotipy.Spotify(auth=token)
-
-# wiz bulb configuration
-config = configparser.ConfigParser()
-config.read(".wizbulb.ini")
-backdrop_bulbs = config["DEFAULT"]["backdrop_bulbs"].split(" ")
-overhead_bulbs = config["DEFAULT"]["overhead_bulbs"].split(" ")
-battlefield_bulbs = config["DEFAULT"]["battlefield_bulbs"].split(" ")
-
-torch_scenes = [5, 28, 31]
-
-backdrop_bulb_objs = []
-for b in backdrop_bulbs:
-    bulb = wizlight(b)
-    backdrop_bulb_objs.append(bulb)
-
-overhead_bulb_objs = []
-for b in (overhead_bulbs + battlefield_bulbs):
-    bulb = wizlight(b)
-    overhead_bulb_objs.append(bulb)
-
-
-async def main():
+torch_scenes = (5, 28, 31)
+
+
+# spotify auth and bulb setup touch disk and network, so only run them as a script
+def _init():
+    # spotify and wiz bulb configuration, parsed together
+    config = configparser.ConfigParser()
+    config.read([".spotify.ini", ".wizbulb.ini"])
+    username = config["DEFAULT"]["username"]
+    spotify_id = config["DEFAULT"]["client_id"]
+    spotify_secret = config["DEFAULT"]["client_secret"]
+    redirectURI = config["DEFAULT"]["redirectURI"]
+    oauth_object = spotipy.SpotifyOAuth(
+        client_id=spotify_id,
+        client_secret=spotify_secret,
+        redirect_uri=redirectURI,
+        scope=scope,
+    )
+    # the auth manager reads the token cache (.cache) and only contacts the
+    # accounts service when the cached token is missing or about to expire
+    spotify = spotipy.Spotify(auth_manager=oauth_object)
+
+    backdrop_bulbs = config["DEFAULT"]["backdrop_bulbs"].split()
+    overhead_bulbs = config["DEFAULT"]["overhead_bulbs"].split()
+    battlefield_bulbs = config["DEFAULT"]["battlefield_bulbs"].split()
+
+    # lists, not tuples: main() shuffles them in place each cycle
+    backdrop_bulb_objs = [get_bulb(b) for b in backdrop_bulbs]
+    overhead_bulb_objs = [get_bulb(b) for b in overhead_bulbs + battlefield_bulbs]
+
+    return spotify, backdrop_bulb_objs, overhead_bulb_objs
+
+
+def initial_backdrop_pilot():
+    dim = 255 - random.randint(0, 180)
+    delta1 = random.randint(0, 19)
+    delta2 = random.randint(0, 19)
+    return PilotBuilder(rgb=(128 + delta1, 128 + delta2, 128 + delta1), brightness=dim)
+
+
+def torch_pilot():
+    dim = 255 - random.randint(0, 59)
+    speed = 10 + random.randint(0, 179)
+    scene = random.choice(torch_scenes)
+    return PilotBuilder(scene=scene, speed=speed, brightness=dim)
+
+
+async def play_sound_effect():
+    # playsound3 blocks until the sound ends, so keep it off the event loop
     try:
-        playsound3.playsound(sound_effect)
+        await asyncio.to_thread(playsound3.playsound, sound_effect)
     except:
         print(f"likely need to make {sound_effect}")
-    spotify.start_playback(context_uri=playlist)
-    for light_bulb in backdrop_bulb_objs:
-        dim = 255 - int(random.random() * 181)
-        delta1 = int(random.random() * 20)
-        delta2 = int(random.random() * 20)
-        await light_bulb.turn_on(
-            PilotBuilder(rgb=(128 + delta1, 128 + delta2, 128 + delta1), brightness=dim)
-        )
-    for light_bulb in overhead_bulb_objs:
-        dim = 255 - int(random.random() * 60)
-        speed = 10 + int(random.random() * 180)
-        scene = random.choice(torch_scenes)
-        await light_bulb.turn_on(PilotBuilder(scene=scene, speed=speed, brightness=dim))
+
+
+async def main(spotify, backdrop_bulb_objs, overhead_bulb_objs):
+    # door sound, spotify request and every bulb's starting state all at once
+    await asyncio.gather(
+        play_sound_effect(),
+        asyncio.to_thread(spotify.start_playback, context_uri=playlist),
+        *(light_bulb.turn_on(initial_backdrop_pilot()) for light_bulb in backdrop_bulb_objs),
+        *(light_bulb.turn_on(torch_pilot()) for light_bulb in overhead_bulb_objs),
+    )
+    # loop invariants and locally bound random helpers for the endless cycle
+    randint = random.randint
+    shuffle = random.shuffle
+    choices = random.choices
+    overhead_count = len(overhead_bulb_objs)
+    backdrop_delay = cycletime / len(backdrop_bulb_objs)
+    overhead_delay = cycletime / len(overhead_bulb_objs)
     while True:
         print("start")
-        random.shuffle(backdrop_bulb_objs)
+        shuffle(backdrop_bulb_objs)
         for light_bulb in backdrop_bulb_objs:
-            if int(random.random() * 100) > 95:
+            if randint(0, 99) > 95:
                 print("flash")
-                flash_bright = 255 - int(random.random() * flash_variance)
+                flash_bright = 255 - randint(0, flash_variance - 1)
                 await light_bulb.turn_on(
                     PilotBuilder(rgb=(255, 255, 255), brightness=flash_bright)
                 )
-                time.sleep(1)
-            dim = 255 - int(random.random() * 181)
-            delta1 = int(random.random() * 30)
-            delta2 = int(random.random() * 30)
+                await asyncio.sleep(1)
+            dim = 255 - randint(0, 180)
+            delta1 = randint(0, 29)
+            delta2 = randint(0, 29)
             await light_bulb.turn_on(
                 PilotBuilder(
                     rgb=(158 + delta1, 158 + delta2, 158 + delta1), brightness=dim
                 )
             )
-            time.sleep(cycletime / len(backdrop_bulb_objs))
-        random.shuffle(overhead_bulb_objs)
-        for light_bulb in overhead_bulb_objs:
-            dim = 255 - int(random.random() * 60)
-            speed = 10 + int(random.random() * 180)
-            scene = random.choice(torch_scenes)
-            await light_bulb.turn_on(
-                PilotBuilder(scene=scene, speed=speed, brightness=dim)
-            )
-            time.sleep(cycletime / len(overhead_bulb_objs))
+            await asyncio.sleep(backdrop_delay)
+        shuffle(overhead_bulb_objs)
+        # draw every torch's scene, speed and dim for this cycle up front
+        scenes = choices(torch_scenes, k=overhead_count)
+        speeds = [10 + randint(0, 179) for _ in range(overhead_count)]
+        dims = [255 - randint(0, 59) for _ in range(overhead_count)]
+        for light_bulb, scene, speed, dim in zip(overhead_bulb_objs, scenes, speeds, dims):
+            await light_bulb.turn_on(PilotBuilder(scene=scene, speed=speed, brightness=dim))
+            await asyncio.sleep(overhead_delay)
 
 
-loop = asyncio.get_event_loop()
-loop.run_until_complete(main())
+if __name__ == "__main__":
+    asyncio.run(main(*_init()))
@@ -1,13 +1,12 @@
 #!/usr/bin/env python3
 import playsound3
-import configparser
 import asyncio
-import time
 import random
 import spotipy
 import webbrowser
 from spotipy.oauth2 import SpotifyClientCredentials
-from pywizlight import wizlight, PilotBuilder, discovery
+from pywizlight import PilotBuilder, discovery
+from bulbs import load_bulb_group, load_config
 
 green = 15
 blue = 15
@@ -16,8 +15,10 @@ flash_variance = 25
 scope = "ugc-image-upload user-read-playback-state user-modify-playback-state user-read-currently-playing app-remote-control streaming"
 playlist = "spotify:playlist:68O4wDfqFOBcDm3RV9dvsF"
 sound_effect = "dooropen.wav"
-config = configparser.ConfigParser()
-config.read(".spotify.ini")
+# the sun never varies, so build its pilot once and reuse it
+sun_pilot = PilotBuilder(scene=12, brightness=255)
+# spotify and wiz bulb configuration, parsed together
+config = load_config()
 username = config["DEFAULT"]["username"]
 spotify_id = config["DEFAULT"]["client_id"]
 spotify_secret = config["DEFAULT"]["client_secret"]
@@ -28,27 +29,33 @@ oauth_object = spotipy.SpotifyOAuth(
     redirect_uri=redirectURI,
     scope=scope,
 )
-token_dict = oauth_object.get_access_token()
-token = token_dict["access_token"]
-spotify = spotipy.Spotify(auth=token)
+# the auth manager reads the token cache (.cache) and only contacts the
+# accounts service when the cached token is missing or about to expire
+spotify = spotipy.Spotify(auth_manager=oauth_object)
 
 # wiz bulb configuration
-config = configparser.ConfigParser()
-config.read(".wizbulb.ini")
-backdrop_bulbs = config["DEFAULT"]["backdrop_bulbs"].split(" ")
-overhead_bulbs = config["DEFAULT"]["overhead_bulbs"].split(" ")
-battlefield_bulbs = config["DEFAULT"]["battlefield_bulbs"].split(" ")
+backdrop_bulb_objs = load_bulb_group("backdrop_bulbs")
+overhead_bulb_objs = load_bulb_group("overhead_bulbs") + load_bulb_group("battlefield_bulbs")
 
 
-backdrop_bulb_objs = []
-for b in backdrop_bulbs:
-    bulb = wizlight(b)
-    backdrop_bulb_objs.append(bulb)
+def backdrop_pilot():
+    dim = 255 - random.randrange(20)
+    speed = 10 + random.randrange(180)
+    return PilotBuilder(scene=31, speed=speed, brightness=dim)
 
-overhead_bulb_objs = []
-for b in (overhead_bulbs + battlefield_bulbs):
-    bulb = wizlight(b)
-    overhead_bulb_objs.append(bulb)
+
+def dusk_pilots(count, fade=None):
+    # draw a whole sweep's jitter in two calls rather than three per bulb
+    dims = random.choices(range(226, 256), k=count)
+    deltas = random.choices(range(50), k=2 * count)
+    pilots = []
+    for dim, delta1, delta2 in zip(dims, deltas[::2], deltas[1::2]):
+        if fade is not None:
+            dim = dim * fade
+        pilots.append(
+            PilotBuilder(rgb=(58 + delta1, 58 + delta2, 158 + delta1), brightness=dim)
+        )
+    return pilots
 
 
 async def main():
@@ -56,54 +63,35 @@ async def main():
         playsound3.playsound(sound_effect)
     except:
         print(f"likely need to make {sound_effect}")
-    spotify.start_playback(context_uri=playlist)
-    for light_bulb in backdrop_bulb_objs:
-        dim = 255 - int(random.random() * 20)
-        speed = 10 + int(random.random() * 180)
-        await light_bulb.turn_on(PilotBuilder(scene=31, speed=speed, brightness=dim))
-    sun = False
+    # spotify request and every backdrop bulb's opening scene all at once
+    await asyncio.gather(
+        asyncio.to_thread(spotify.start_playback, context_uri=playlist),
+        *(light_bulb.turn_on(backdrop_pilot()) for light_bulb in backdrop_bulb_objs),
+    )
     random.shuffle(overhead_bulb_objs)
+    sun_bulb, *others = overhead_bulb_objs
+    # be the sun
+    await sun_bulb.turn_on(sun_pilot)
     for i in range(3):
-        for light_bulb in overhead_bulb_objs:
-            if sun == False:
-                sun = True
-                await light_bulb.turn_on(PilotBuilder(scene=12, brightness=255))
-            else:
-                dim = 255 - int(random.random() * 30)
-                dim = dim * (i + 1) / 3
-                delta1 = int(random.random() * 50)
-                delta2 = int(random.random() * 50)
-                await light_bulb.turn_on(
-                    PilotBuilder(
-                        rgb=(58 + delta1, 58 + delta2, 158 + delta1), brightness=dim
-                    )
-                )
-        time.sleep(5)
+        # each fade-in step goes to the other overhead bulbs at once
+        pilots = dusk_pilots(len(others), (i + 1) / 3)
+        await asyncio.gather(
+            *(light_bulb.turn_on(pilot) for light_bulb, pilot in zip(others, pilots))
+        )
+        await asyncio.sleep(5)
     while True:
         print("start")
         random.shuffle(backdrop_bulb_objs)
         for light_bulb in backdrop_bulb_objs:
-            dim = 255 - int(random.random() * 20)
-            speed = 10 + int(random.random() * 180)
-            await light_bulb.turn_on(
-                PilotBuilder(scene=31, speed=speed, brightness=dim)
-            )
-            time.sleep(cycletime / len(backdrop_bulb_objs))
-        sun = False
+            await light_bulb.turn_on(backdrop_pilot())
+            await asyncio.sleep(cycletime / len(backdrop_bulb_objs))
         random.shuffle(overhead_bulb_objs)
-        for light_bulb in overhead_bulb_objs:
-            if sun == False:
-                sun = True
-                await light_bulb.turn_on(PilotBuilder(scene=12, brightness=255))
-            else:
-                dim = 255 - int(random.random() * 30)
-                delta1 = int(random.random() * 50)
-                delta2 = int(random.random() * 50)
-                await light_bulb.turn_on(
-                    PilotBuilder(
-                        rgb=(58 + delta1, 58 + delta2, 158 + delta1), brightness=dim
-                    )
-                )
+        sun_bulb, *others = overhead_bulb_objs
+        pilots = dusk_pilots(len(others))
+        await asyncio.gather(
+            sun_bulb.turn_on(sun_pilot),
+            *(light_bulb.turn_on(pilot) for light_bulb, pilot in zip(others, pilots)),
+        )
 
 
 loop = asyncio.get_event_loop()
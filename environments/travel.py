@@ -1,13 +1,12 @@
 #!/usr/bin/env python3
 import playsound3
-import configparser
 import asyncio
-import time
 import random
 import spotipy
 import webbrowser
 from spotipy.oauth2 import SpotifyClientCredentials
-from pywizlight import wizlight, PilotBuilder, discovery
+from pywizlight import PilotBuilder, discovery
+from bulbs import load_bulb_group, load_config
 
 green = 15
 blue = 15
@@ -16,8 +15,10 @@ flash_variance = 25
 scope = "ugc-image-upload user-read-playback-state user-modify-playback-state user-read-currently-playing app-remote-control streaming"
 playlist = "spotify:playlist:3Vz5yr3PL1xIIAe89mPfT4"
 sound_effect = "chill.wav"
-config = configparser.ConfigParser()
-config.read(".spotify.ini")
+# the sun never varies, so build its pilot once and reuse it
+sun_pilot = PilotBuilder(scene=12, brightness=255)
+# spotify and wiz bulb configuration, parsed together
+config = load_config()
 username = config["DEFAULT"]["username"]
 spotify_id = config["DEFAULT"]["client_id"]
 spotify_secret = config["DEFAULT"]["client_secret"]
@@ -28,34 +29,29 @@ oauth_object = spotipy.SpotifyOAuth(
     redirect_uri=redirectURI,
     scope=scope,
 )
-token_dict = oauth_object.get_access_token()
-token = token_dict["access_token"]
-spotify = spotipy.Spotify(auth=token)
-spotify.start_playback(context_uri=playlist)
-
-backdrop_bulbs = ["192.168.1.165", "192.168.1.159", "192.168.1.160"]
+# the auth manager reads the token cache (.cache) and only contacts the
+# accounts service when the cached token is missing or about to expire
+spotify = spotipy.Spotify(auth_manager=oauth_object)
 
 # wiz bulb configuration
-config = configparser.ConfigParser()
-config.read(".wizbulb.ini")
-backdrop_bulbs = config["DEFAULT"]["backdrop_bulbs"].split(" ")
-overhead_bulbs = config["DEFAULT"]["overhead_bulbs"].split(" ")
-battlefield_bulbs = config["DEFAULT"]["battlefield_bulbs"].split(" ")
+backdrop_bulb_objs = load_bulb_group("backdrop_bulbs")
+overhead_bulb_objs = load_bulb_group("overhead_bulbs")
+battlefield_bulb_objs = load_bulb_group("battlefield_bulbs")
+
 
-backdrop_bulb_objs = []
-for b in backdrop_bulbs:
-    bulb = wizlight(b)
-    backdrop_bulb_objs.append(bulb)
+def backdrop_pilot():
+    dim = 255 - random.randrange(20)
+    speed = 10 + random.randrange(180)
+    return PilotBuilder(scene=7, speed=speed, brightness=dim)
 
-overhead_bulb_objs = []
-for b in overhead_bulbs:
-    bulb = wizlight(b)
-    overhead_bulb_objs.append(bulb)
 
-battlefield_bulb_objs = []
-for b in battlefield_bulbs:
-    bulb = wizlight(b)
-    battlefield_bulb_objs.append(bulb)
+def dusk_pilot(fade=None):
+    dim = 255 - random.randrange(30)
+    if fade is not None:
+        dim = dim * fade
+    delta1 = random.randrange(50)
+    delta2 = random.randrange(50)
+    return PilotBuilder(rgb=(58 + delta1, 58 + delta2, 158 + delta1), brightness=dim)
 
 
 async def main():
@@ -63,62 +59,40 @@ async def main():
         playsound3.playsound(sound_effect)
     except:
         print(f"likely need to make {sound_effect}")
-    for light_bulb in backdrop_bulb_objs:
-        dim = 255 - int(random.random() * 20)
-        speed = 10 + int(random.random() * 180)
-        await light_bulb.turn_on(PilotBuilder(scene=7, speed=speed, brightness=dim))
-    sun = False
+    # spotify request and every backdrop bulb's opening scene all at once
+    await asyncio.gather(
+        asyncio.to_thread(spotify.start_playback, context_uri=playlist),
+        *(light_bulb.turn_on(backdrop_pilot()) for light_bulb in backdrop_bulb_objs),
+    )
     random.shuffle(overhead_bulb_objs)
     for i in range(3):
-        for light_bulb in (overhead_bulb_objs + battlefield_bulb_objs):
-            dim = 255 - int(random.random() * 30)
-            dim = dim * (i + 1) / 3
-            delta1 = int(random.random() * 50)
-            delta2 = int(random.random() * 50)
-            await light_bulb.turn_on(
-                PilotBuilder(
-                    rgb=(58 + delta1, 58 + delta2, 158 + delta1), brightness=dim
-                )
+        # each fade-in step goes to every overhead bulb at once
+        await asyncio.gather(
+            *(
+                light_bulb.turn_on(dusk_pilot((i + 1) / 3))
+                for light_bulb in overhead_bulb_objs + battlefield_bulb_objs
             )
-        time.sleep(5)
+        )
+        await asyncio.sleep(5)
+    # locally bound for the endless cycle
+    randrange = random.randrange
     while True:
         print("start")
         random.shuffle(backdrop_bulb_objs)
-        if int(random.random() * 100) > 95:
+        if randrange(100) > 95:
             for light_bulb in backdrop_bulb_objs:
-                dim = 255 - int(random.random() * 20)
-                speed = 10 + int(random.random() * 180)
-                await light_bulb.turn_on(
-                    PilotBuilder(scene=7, speed=speed, brightness=dim)
-                )
-                time.sleep(cycletime / len(backdrop_bulb_objs))
-        sun = False
+                await light_bulb.turn_on(backdrop_pilot())
+                await asyncio.sleep(cycletime / len(backdrop_bulb_objs))
         random.shuffle(overhead_bulb_objs)
-        for light_bulb in overhead_bulb_objs:
-            if light_bulb not in battlefield_bulb_objs and sun == False:
-                sun = True
-                await light_bulb.turn_on(PilotBuilder(scene=12, brightness=255))
-                time.sleep(cycletime * int(random.random() * 6))
-            else:
-                dim = 255 - int(random.random() * 30)
-                delta1 = int(random.random() * 50)
-                delta2 = int(random.random() * 50)
-                await light_bulb.turn_on(
-                    PilotBuilder(
-                        rgb=(58 + delta1, 58 + delta2, 158 + delta1), brightness=dim
-                    )
-                )
-                time.sleep(cycletime / len(overhead_bulb_objs))
+        sun_bulb, *others = overhead_bulb_objs
+        await sun_bulb.turn_on(sun_pilot)
+        await asyncio.sleep(cycletime * randrange(6))
+        for light_bulb in others:
+            await light_bulb.turn_on(dusk_pilot())
+            await asyncio.sleep(cycletime / len(overhead_bulb_objs))
         for light_bulb in battlefield_bulb_objs:
-            dim = 255 - int(random.random() * 30)
-            delta1 = int(random.random() * 50)
-            delta2 = int(random.random() * 50)
-            await light_bulb.turn_on(
-                PilotBuilder(
-                    rgb=(58 + delta1, 58 + delta2, 158 + delta1), brightness=dim
-                )
-            )
-            time.sleep(cycletime / len(overhead_bulb_objs))
+            await light_bulb.turn_on(dusk_pilot())
+            await asyncio.sleep(cycletime / len(overhead_bulb_objs))
 
 
 loop = asyncio.get_event_loop()
@@ -0,0 +1,9 @@
+# shared wizlight objects, one per bulb IP, for the environment scripts
+from functools import lru_cache
+from pywizlight import wizlight
+
+
+@lru_cache(maxsize=256)
+def get_bulb(ip):
+    # reuse the same wizlight (and its UDP transport) whenever an IP is asked for again
+    return wizlight(ip)
@@ -7,25 +7,31 @@ A PyQt6 GUI for managing ambient environment configs with Spotify and smart ligh
 import sys
 import asyncio
 import copy
+import functools
 import threading
 import random
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Set
+from typing import List, Dict, Optional, Any, Set, Tuple, Callable, TYPE_CHECKING
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QGridLayout, QPushButton,
     QStatusBar, QMessageBox, QVBoxLayout, QTabWidget, QHBoxLayout,
     QLabel, QFrame, QSizePolicy, QStyleFactory, QMenuBar,
-    QMenu, QDialog, QListWidget, QListWidgetItem, QStackedWidget,
+    QMenu, QDialog, QListWidget, QListWidgetItem, QListView, QStackedWidget,
     QRadioButton, QButtonGroup, QGroupBox, QSplitter, QLineEdit,
-    QAbstractItemView, QScrollArea, QCheckBox
+    QAbstractItemView, QScrollArea, QCheckBox, QGraphicsDropShadowEffect
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QThread, pyqtSignal, QSize, QRect, QVariantAnimation,
+    QAbstractListModel, QModelIndex, QEventLoop
 )
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize, QRect
 from PyQt6.QtGui import (
     QKeySequence, QPalette, QColor, QPainter, QPen, QFont, QIcon, QAction,
-    QShortcut
+    QShortcut, QBrush
 )
 
 from config_loader import ConfigLoader
@@ -55,6 +61,36 @@ SOUND_CATEGORIES = [
 SPECIAL_CATEGORIES = ["hidden"]
 
 
+@dataclass(slots=True)
+class ButtonSpec:
+    """Per-config button flags, extracted once from the nested config dict."""
+    name: str
+    is_loop: bool
+    sound_enabled: bool
+    spotify_enabled: bool
+    atmosphere_enabled: bool
+    lights_enabled: bool
+    icon: str
+    description: str
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ButtonSpec":
+        """Build a spec from a loaded environment config."""
+        engines = config.get("engines", {})
+        sound = engines.get("sound", {})
+        return cls(
+            name=config["name"],
+            # Loop-capable sounds can be mixed into the atmosphere
+            is_loop=bool(config.get("metadata", {}).get("loop", False) or sound.get("loop", False)),
+            sound_enabled=sound.get("enabled", False),
+            spotify_enabled=engines.get("spotify", {}).get("enabled", False),
+            atmosphere_enabled=engines.get("atmosphere", {}).get("enabled", False),
+            lights_enabled=engines.get("lights", {}).get("enabled", False),
+            icon=config.get("icon", ""),
+            description=config.get("description", ""),
+        )
+
+
 class SettingsManager:
     """Manages application settings via settings.ini file."""
 
@@ -110,6 +146,28 @@ class SettingsManager:
         """Set the theme setting."""
         self.set("appearance", "theme", theme)
 
+    def get_cached_dark_mode(self, validity_key: str) -> Optional[bool]:
+        """Get the cached system dark-mode result, or None if missing or stale.
+
+        Args:
+            validity_key: Key describing the current system theme sources;
+                          the cache is only valid if it was stored with the same key.
+        """
+        if self.get("appearance", "detected_dark_mode_key") != validity_key:
+            return None
+        value = self.get("appearance", "detected_dark_mode")
+        if value not in ("true", "false"):
+            return None
+        return value == "true"
+
+    def set_cached_dark_mode(self, is_dark: bool, validity_key: str) -> None:
+        """Cache the system dark-mode result together with its validity key."""
+        if "appearance" not in self.config:
+            self.config["appearance"] = {}
+        self.config["appearance"]["detected_dark_mode"] = "true" if is_dark else "false"
+        self.config["appearance"]["detected_dark_mode_key"] = validity_key
+        self._save()
+
     def get_spotify_auto_start(self) -> str:
         """Get Spotify auto-start setting: 'always', 'never', or 'ask'."""
         return self.get("spotify", "auto_start", "ask")
@@ -183,15 +241,27 @@ class WizBulbConfigManager:
     """Manages WIZ bulb configuration in .wizbulb.ini file."""
 
     CONFIG_FILE = ".wizbulb.ini"
+    BULB_GROUPS = ["backdrop_bulbs", "overhead_bulbs", "battlefield_bulbs"]
 
     def __init__(self):
         self.config_path = Path(self.CONFIG_FILE)
         self.config = configparser.ConfigParser()
+        self._cached_ip_list: Optional[List[str]] = None
+        self._loaded_mtime: Optional[float] = None
         self._load()
 
+    def _file_mtime(self) -> Optional[float]:
+        """Return the config file's modification time, or None if it doesn't exist."""
+        try:
+            return self.config_path.stat().st_mtime
+        except OSError:
+            return None
+
     def _load(self) -> None:
         """Load config from file if it exists."""
-        if self.config_path.exists():
+        self._cached_ip_list = None
+        self._loaded_mtime = self._file_mtime()
+        if self._loaded_mtime is not None:
             self.config.read(self.config_path)
 
     def exists(self) -> bool:
@@ -224,6 +294,24 @@ class WizBulbConfigManager:
         }
         with open(self.config_path, "w") as f:
             self.config.write(f)
+        self._cached_ip_list = None
+        self._loaded_mtime = self._file_mtime()
+
+    def get_all_ips_cached(self) -> List[str]:
+        """Get the IPs of all configured bulbs across every group.
+
+        The parsed list is cached and only rebuilt after a save, or when the
+        file has been rewritten by another manager instance (e.g. the settings dialog).
+        """
+        if self._file_mtime() != self._loaded_mtime:
+            self.config = configparser.ConfigParser()
+            self._load()
+        if self._cached_ip_list is None:
+            all_ips = []
+            for group in self.BULB_GROUPS:
+                all_ips.extend(self.get(group, "").split())
+            self._cached_ip_list = all_ips
+        return self._cached_ip_list
 
 
 class SettingsDialog(QDialog):
@@ -701,14 +789,10 @@ class SettingsDialog(QDialog):
         )
 
 
-from engines import (
-    SoundEngine, SpotifyEngine, LightsEngine, stop_all_sounds,
-    register_sound_process, unregister_sound_process,
-    AtmosphereEngine, stop_all_atmosphere,
-    SpotifyNoActiveDeviceError, is_spotify_running, is_spotify_in_path,
-    start_spotify, wait_for_spotify_device,
-    disable_lights_for_session,
-)
+# Engine modules (spotipy, pywizlight, etc.) are imported where they are first
+# used, so the window can paint before they load
+if TYPE_CHECKING:
+    from engines import SpotifyEngine, LightsEngine
 
 
 class OutlinedLabel(QLabel):
@@ -1410,17 +1494,25 @@ class EngineRunner(QThread):
     download_started = pyqtSignal(str)  # download title
     download_finished = pyqtSignal()    # download complete
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any],
+                 get_spotify_engine: Optional[Callable[[], "SpotifyEngine"]] = None):
+        from engines import SpotifyEngine
         super().__init__()
         self.config = config
-        self.lights_engine: Optional[LightsEngine] = None
+        # Shared SpotifyEngine provider (falls back to a fresh engine per run)
+        self._get_spotify_engine = get_spotify_engine or SpotifyEngine
+        self.lights_engine: Optional["LightsEngine"] = None
         self.running = False
         self.has_lights = config["engines"]["lights"]["enabled"]
         self.has_atmosphere = config["engines"].get("atmosphere", {}).get("enabled", False)
         self._sound_done_event = threading.Event()
+        # Set from stop() to wake the lights loop (created on the runner's event loop)
+        self._stop_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def run(self):
         """Run the engines based on configuration."""
+        from engines import AtmosphereEngine, SpotifyNoActiveDeviceError
         try:
             self.running = True
 
@@ -1454,7 +1546,7 @@ class EngineRunner(QThread):
                 context_uri = self.config["engines"]["spotify"]["context_uri"]
                 self.status_update.emit(f"Starting Spotify...")
                 try:
-                    spotify_engine = SpotifyEngine()
+                    spotify_engine = self._get_spotify_engine()
                     spotify_engine.play_context_with_device_check(context_uri)
                     self.status_update.emit("Spotify playback started")
                     # Try to get playlist name from Spotify API
@@ -1541,6 +1633,7 @@ class EngineRunner(QThread):
 
     def _play_sound_async(self, sound_file: str, sound_enabled: bool) -> None:
         """Handle sound download and playback in a separate thread."""
+        from engines import register_sound_process, unregister_sound_process
         try:
             # Check if this is a sound_conf reference (e.g., "sound_conf:squeaky_door")
             # and resolve it to a randomly selected sound
@@ -1628,17 +1721,17 @@ class EngineRunner(QThread):
                         # Register process so it can be stopped
                         register_sound_process(proc)
 
-                        # Handle fadeout - terminate after specified milliseconds
+                        # Handle fadeout - terminate after specified milliseconds,
+                        # cancelled as soon as the player exits on its own
+                        fadeout_timer = None
                         if sound_fadeout is not None and sound_fadeout > 0:
-                            import threading
-                            def fadeout_terminate():
-                                import time
-                                time.sleep(sound_fadeout / 1000.0)
-                                if proc.poll() is None:  # Still running
-                                    proc.terminate()
-                            threading.Thread(target=fadeout_terminate, daemon=True).start()
+                            fadeout_timer = threading.Timer(sound_fadeout / 1000.0, proc.terminate)
+                            fadeout_timer.daemon = True
+                            fadeout_timer.start()
 
                         proc.wait()
+                        if fadeout_timer is not None:
+                            fadeout_timer.cancel()
                         # Unregister when done
                         unregister_sound_process(proc)
                         break
@@ -1727,6 +1820,7 @@ engines:
 
     async def _run_lights(self):
         """Run the lights engine asynchronously."""
+        from engines import LightsEngine
         self.lights_engine = LightsEngine()
         animation_config = self.config["engines"]["lights"]["animation"]
 
@@ -1735,15 +1829,24 @@ engines:
         self.status_update.emit(f"Light animation running: {config_name}")
         self.lights_started.emit(config_name)
 
-        # Keep running until stopped (check frequently for fast response)
-        while self.running:
-            await asyncio.sleep(0.05)
+        # Sleep until stop() wakes us - no periodic polling
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        if self.running:
+            await self._stop_event.wait()
 
         await self.lights_engine.stop()
 
     def stop(self):
         """Stop the engines."""
         self.running = False
+        # Wake the lights loop if it is waiting
+        loop = self._loop
+        if loop is not None and self._stop_event is not None:
+            try:
+                loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                pass  # Loop already closed
         # Don't block - let the old thread clean up in background
         # New environment can start immediately
 
@@ -1846,9 +1949,116 @@ class CategoryItemWidget(QWidget):
         return self._atmosphere_count
 
 
+class CategoryListModel(QAbstractListModel):
+    """Model for the category sidebar: one row per category plus an optional separator row.
+
+    Category rows carry no display text - their CategoryItemWidget is set as the
+    index widget. The separator row (category None) is drawn as centered grey text.
+    """
+
+    SEPARATOR_TEXT = "── SOUNDS ──"
+    CATEGORY_ROW_SIZE = QSize(0, 50)
+    SEPARATOR_ROW_SIZE = QSize(0, 28)
+
+    def __init__(self, rows: List[Optional[str]], parent=None):
+        super().__init__(parent)
+        self._rows = rows  # category name per row, None for the separator
+        self._names = [
+            category.replace("_", " ").title() if category else self.SEPARATOR_TEXT
+            for category in rows
+        ]
+        self._row_of: Dict[str, int] = {
+            category: row for row, category in enumerate(rows) if category is not None
+        }
+        self._separator_font = QFont()
+        self._separator_font.setBold(True)
+        self._separator_font.setPointSize(9)
+        self._separator_brush = QBrush(QColor("#888888"))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        is_separator = self._rows[row] is None
+        if role == Qt.ItemDataRole.SizeHintRole:
+            return self.SEPARATOR_ROW_SIZE if is_separator else self.CATEGORY_ROW_SIZE
+        if role == Qt.ItemDataRole.AccessibleTextRole:
+            return self._names[row]
+        if is_separator:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.SEPARATOR_TEXT
+            if role == Qt.ItemDataRole.FontRole:
+                return self._separator_font
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._separator_brush
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def flags(self, index):
+        if index.isValid() and self._rows[index.row()] is None:
+            return Qt.ItemFlag.NoItemFlags  # Non-selectable separator
+        return super().flags(index)
+
+    def category_at(self, row: int) -> Optional[str]:
+        """Get the category name at a row (None for the separator or out of range)."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def row_of(self, category: str) -> int:
+        """Get the row for a category name (-1 if not present)."""
+        return self._row_of.get(category, -1)
+
+    def append_category(self, category: str) -> int:
+        """Append a category row and return its row number."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(category)
+        self._names.append(category.replace("_", " ").title())
+        self._row_of[category] = row
+        self.endInsertRows()
+        return row
+
+
+class CategoryListView(QListView):
+    """QListView with the row-based convenience API of QListWidget used by the launcher."""
+
+    currentRowChanged = pyqtSignal(int)
+
+    def setModel(self, model) -> None:
+        super().setModel(model)
+        self.selectionModel().currentRowChanged.connect(
+            lambda current, previous: self.currentRowChanged.emit(current.row())
+        )
+
+    def count(self) -> int:
+        model = self.model()
+        return model.rowCount() if model is not None else 0
+
+    def currentRow(self) -> int:
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row: int) -> None:
+        self.setCurrentIndex(self.model().index(row, 0))
+
+    def keyPressEvent(self, event) -> None:
+        """Pass plain letter keys up to the window instead of using them for keyboard search."""
+        if event.modifiers() == Qt.KeyboardModifier.NoModifier and event.text().isalpha():
+            event.ignore()
+            return
+        super().keyPressEvent(event)
+
+
 class EnvironmentLauncher(QMainWindow):
     """Main PyQt6 window for the environment launcher with tabs."""
 
+    # Emitted from worker threads as each exit cleanup task completes
+    _exit_task_done = pyqtSignal()
+
     # Keyboard shortcuts (applied to current tab only)
     KEYS = [
         "Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P",
@@ -1856,14 +2066,43 @@ class EnvironmentLauncher(QMainWindow):
         "Z", "X", "C", "V", "B", "N", "M",
     ]
 
-    # Button styles (font-size 17px for larger name display)
-    ACTIVE_STYLE = "background-color: #4CAF50; color: white; padding: 8px; font-size: 17px;"
-    ATMOSPHERE_ACTIVE_STYLE = "background-color: #5B9BD5; color: white; padding: 8px; font-size: 17px;"  # Blue for atmosphere members
-    INACTIVE_STYLE = "padding: 8px; font-size: 17px;"
+    # Environment button styles (font-size 17px for larger name display),
+    # applied window-wide and selected by the button's "state" property
+    BUTTON_STATE_STYLE = """
+        IconButton { padding: 8px; font-size: 17px; }
+        IconButton[state="active"] { background-color: #4CAF50; color: white; }
+        IconButton[state="atmosphere"] { background-color: #5B9BD5; color: white; }
+    """
     STOP_STYLE = "background-color: #f44336; color: white; font-weight: bold; font-size: 12px;"
     DESC_STYLE = "font-size: 11px; color: #666; padding: 2px 4px; border: 1px solid #ccc; border-radius: 3px; background-color: #fafafa;"
     DESC_STYLE_DARK = "font-size: 11px; color: #aaa; padding: 2px 4px; border: 1px solid #555; border-radius: 3px; background-color: #2a2a2a;"
 
+    # Engine indicator badges shown below each button: (kind, emoji, sound-only emoji)
+    _BADGE_SPECS = [
+        ("sound", "🔊", "📢"),
+        ("spotify", "🎵", None),
+        ("atmosphere", "🌊", None),
+        ("lights", "💡", None),
+        ("loop", "🔁", None),
+    ]
+
+    # Badge styles, applied window-wide by objectName ("badge_<kind>")
+    BADGE_STYLE = """
+        QLabel#badge_sound, QLabel#badge_spotify, QLabel#badge_atmosphere,
+        QLabel#badge_lights, QLabel#badge_loop {
+            padding: 0px 6px;
+            border: 1px solid gray;
+            border-radius: 3px;
+            font-size: 14px;
+            color: black;
+        }
+        QLabel#badge_sound { background-color: #FFCBA4; }
+        QLabel#badge_spotify { background-color: #B4F0A8; }
+        QLabel#badge_atmosphere { background-color: #B4E8F0; }
+        QLabel#badge_lights { background-color: #FFF9B0; }
+        QLabel#badge_loop { background-color: #E0B4F0; }
+    """
+
     # Global tooltip style for readability in both light and dark modes
     TOOLTIP_STYLE = """
         QToolTip {
@@ -1884,15 +2123,20 @@ class EnvironmentLauncher(QMainWindow):
         self.setMinimumSize(800, 400)
         # Maximum size prevents layout issues with many buttons
 
-        # Apply tooltip style globally to all child widgets
-        self.setStyleSheet(self.TOOLTIP_STYLE)
-
         # Detect dark mode based on settings
         self.is_dark_mode = self._is_dark_mode_enabled()
 
+        # Apply tooltip, badge, button state and description styles globally
+        self._apply_window_style()
+
         # Load configurations
         self.config_loader = ConfigLoader("env_conf")
         self.configs = self._load_and_organize_configs()
+        self.specs: Dict[str, ButtonSpec] = {
+            config["name"]: ButtonSpec.from_config(config)
+            for configs in self.configs.values()
+            for config in configs
+        }
 
         # Track active environment
         self.current_runner: Optional[EngineRunner] = None
@@ -1900,13 +2144,24 @@ class EnvironmentLauncher(QMainWindow):
         self.lights_runner: Optional[EngineRunner] = None  # Runner with active lights
         self.lights_config_name: Optional[str] = None  # Config name with active lights
         self.buttons: Dict[str, QPushButton] = {}  # config_name -> button
-        self.shortcuts: List[QShortcut] = []
+        self._button_to_name: Dict[int, str] = {}  # id(button) -> config_name
+        self._key_to_config: Dict[int, Dict[str, Any]] = {}  # Qt key code -> config on current tab
+        self._last_tab_index = -1  # Tab the shortcuts currently point at
         self._old_runners: List[EngineRunner] = []  # Keep refs until threads finish
         self.tab_configs: Dict[int, List[Dict[str, Any]]] = {}  # tab_index -> configs
         self._pending_search_button: Optional[QPushButton] = None  # Button from search result
+        self._active_button_name: Optional[str] = None  # Name highlighted by _update_active_button
+        self._button_state: Dict[str, str] = {}  # config_name -> "active"/"atmosphere" (absent = inactive)
+        self._spotify_engine: Optional["SpotifyEngine"] = None  # Authenticated once, reused
+        self._spotify_engine_lock = threading.Lock()  # Runner threads share the engine
 
         # Track active atmosphere sounds (URLs currently playing in atmosphere)
         self.active_atmosphere_urls: Set[str] = set()
+        self._atmosphere_button_names: Set[str] = set()  # Config names for active_atmosphere_urls
+
+        # Persistent event loop (background thread) for one-off bulb commands
+        self._lights_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._warm_white_bulbs: Dict[str, Any] = {}  # ip -> wizlight, reused on the lights loop
         self.url_to_config: Dict[str, Dict[str, Any]] = {}  # URL -> config mapping
 
         # Track config -> category mapping for badge updates
@@ -1938,6 +2193,10 @@ class EnvironmentLauncher(QMainWindow):
         # Flag to prevent startup checks from running twice
         self._startup_spotify_checked = False
 
+        # Exit state: set once the user confirmed closing while lights were running
+        self._closing = False
+        self._exit_finalized = False
+
         # Create immersive status bar
         self.immersive_status = ImmersiveStatusBar(self)
 
@@ -1988,6 +2247,7 @@ class EnvironmentLauncher(QMainWindow):
 
     def _on_bulb_check_complete(self, results: Dict[str, bool], groups: Dict[str, List[str]]) -> None:
         """Handle bulb check results."""
+        from engines import disable_lights_for_session
         self.immersive_status.clear_message()
 
         # Find unavailable bulbs
@@ -2044,6 +2304,7 @@ class EnvironmentLauncher(QMainWindow):
 
     def _check_startup_spotify(self) -> None:
         """Check Spotify status on startup and optionally play music."""
+        from engines import is_spotify_running, is_spotify_in_path
         # Prevent running twice
         if self._startup_spotify_checked:
             return
@@ -2082,7 +2343,7 @@ class EnvironmentLauncher(QMainWindow):
 
         # Try to connect to Spotify and check for active device
         try:
-            engine = SpotifyEngine()
+            engine = self._get_spotify_engine()
             local_device = engine.get_local_computer_device()
 
             if local_device:
@@ -2137,6 +2398,7 @@ class EnvironmentLauncher(QMainWindow):
             spotify_available: Whether Spotify executable is in PATH
             then_play_config: If provided, auto-start this config after Spotify is ready
         """
+        from engines import start_spotify
         if spotify_running:
             # Spotify is running but no device - need user to activate it
             QMessageBox.information(
@@ -2175,7 +2437,7 @@ class EnvironmentLauncher(QMainWindow):
 
         # Check if Spotify device is now available
         try:
-            engine = SpotifyEngine()
+            engine = self._get_spotify_engine()
             local_device = engine.get_local_computer_device()
 
             if local_device:
@@ -2307,6 +2569,7 @@ class EnvironmentLauncher(QMainWindow):
 
     def _handle_spotify_no_device(self) -> None:
         """Handle case where Spotify has no active device on this PC."""
+        from engines import is_spotify_running, is_spotify_in_path
         auto_start = self.settings_manager.get_spotify_auto_start()
 
         # If disabled, just silently continue without music
@@ -2321,7 +2584,7 @@ class EnvironmentLauncher(QMainWindow):
         # Try to get remote devices for the "use remote" option
         remote_devices = []
         try:
-            engine = SpotifyEngine()
+            engine = self._get_spotify_engine()
             remote_devices = engine.get_remote_devices()
         except:
             pass
@@ -2340,6 +2603,7 @@ class EnvironmentLauncher(QMainWindow):
 
     def _do_start_local_spotify(self, spotify_running: bool, spotify_available: bool) -> None:
         """Try to start Spotify locally."""
+        from engines import start_spotify
         if spotify_running:
             QMessageBox.information(
                 self,
@@ -2389,7 +2653,7 @@ class EnvironmentLauncher(QMainWindow):
         if len(remote_devices) == 1:
             device = remote_devices[0]
             try:
-                engine = SpotifyEngine()
+                engine = self._get_spotify_engine()
                 if engine.transfer_to_device(device["id"], start_playback=False):
                     self.immersive_status.set_message(f"Connected to {device['name']}", timeout_ms=3000)
                     QMessageBox.information(
@@ -2419,7 +2683,7 @@ class EnvironmentLauncher(QMainWindow):
             idx = device_names.index(choice)
             device = remote_devices[idx]
             try:
-                engine = SpotifyEngine()
+                engine = self._get_spotify_engine()
                 if engine.transfer_to_device(device["id"], start_playback=False):
                     self.immersive_status.set_message(f"Connected to {device['name']}", timeout_ms=3000)
                 else:
@@ -2499,6 +2763,96 @@ class EnvironmentLauncher(QMainWindow):
         dialog.reject()
         self.immersive_status.set_message("Continuing without music", timeout_ms=3000)
 
+    def _apply_window_style(self) -> None:
+        """Set the window-wide stylesheet shared by all child widgets.
+
+        Parsed once here instead of once per widget; description labels pick
+        the light or dark variant via their "env_desc" object name.
+        """
+        desc_style = self.DESC_STYLE_DARK if self.is_dark_mode else self.DESC_STYLE
+        self.setStyleSheet(
+            self.TOOLTIP_STYLE + self.BADGE_STYLE + self.BUTTON_STATE_STYLE
+            + f"QLabel#env_desc {{ {desc_style} }}"
+        )
+
+    def _apply_theme_styles(self) -> None:
+        """Apply the light or dark stylesheets of the search bar and category list."""
+        if self.is_dark_mode:
+            self.search_bar.setStyleSheet("""
+                QLineEdit {
+                    padding: 6px 10px;
+                    border: 1px solid #555;
+                    border-radius: 4px;
+                    background-color: #2d2d2d;
+                    color: white;
+                }
+                QLineEdit:focus {
+                    border: 2px solid #4CAF50;
+                }
+            """)
+        else:
+            self.search_bar.setStyleSheet("""
+                QLineEdit {
+                    padding: 6px 10px;
+                    border: 1px solid #ccc;
+                    border-radius: 4px;
+                }
+                QLineEdit:focus {
+                    border: 2px solid #4CAF50;
+                }
+            """)
+
+        if self.is_dark_mode:
+            self.category_list.setStyleSheet("""
+                QListView {
+                    font-size: 14px;
+                    padding: 5px;
+                    background-color: #2d2d2d;
+                    border: none;
+                }
+                QListView::item {
+                    padding: 10px 8px;
+                    border-radius: 4px;
+                    margin: 2px 4px;
+                    color: white;
+                }
+                QListView::item:selected {
+                    background-color: #4CAF50;
+                    color: white;
+                }
+                QListView::item:hover:!selected {
+                    background-color: #404040;
+                }
+            """)
+        else:
+            self.category_list.setStyleSheet("""
+                QListView {
+                    font-size: 14px;
+                    padding: 5px;
+                    border: none;
+                }
+                QListView::item {
+                    padding: 10px 8px;
+                    border-radius: 4px;
+                    margin: 2px 4px;
+                }
+                QListView::item:selected {
+                    background-color: #4CAF50;
+                    color: white;
+                }
+                QListView::item:hover:!selected {
+                    background-color: #e0e0e0;
+                }
+            """)
+
+    def set_dark_mode(self, is_dark: bool) -> None:
+        """Switch the launcher's own styles between light and dark mode."""
+        if is_dark == self.is_dark_mode:
+            return
+        self.is_dark_mode = is_dark
+        self._apply_window_style()
+        self._apply_theme_styles()
+
     def _is_dark_mode_enabled(self) -> bool:
         """Check if dark mode should be enabled based on settings."""
         theme = self.settings_manager.get_theme()
@@ -2512,8 +2866,8 @@ class EnvironmentLauncher(QMainWindow):
     def _detect_system_dark_mode(self) -> bool:
         """Detect if the system is using dark mode."""
         # This is called during init before palette may be set
-        # Use external detection
-        return detect_system_dark_mode()
+        # Use external detection (cached in settings)
+        return detect_system_dark_mode(self.settings_manager)
 
     def _create_menu(self) -> None:
         """Create the application menu bar."""
@@ -2541,6 +2895,9 @@ class EnvironmentLauncher(QMainWindow):
         """Show the settings dialog."""
         dialog = SettingsDialog(self.settings_manager, self)
         dialog.exec()
+        # Credentials may have changed - re-authenticate on next Spotify use
+        with self._spotify_engine_lock:
+            self._spotify_engine = None
 
     def _detect_dark_mode(self) -> bool:
         """Detect if the system is using dark mode based on window background color."""
@@ -2607,6 +2964,16 @@ class EnvironmentLauncher(QMainWindow):
                 sound_file = config.get("engines", {}).get("sound", {}).get("file", "")
                 if sound_file and "freesound.org" in sound_file:
                     self.url_to_config[sound_file] = config
+        self._refresh_atmosphere_button_names()
+
+    def _refresh_atmosphere_button_names(self) -> None:
+        """Recompute the config names of active atmosphere sounds after the URL set changes."""
+        names = set()
+        for url in self.active_atmosphere_urls:
+            cfg = self.url_to_config.get(url)
+            if cfg:
+                names.add(cfg.get("name"))
+        self._atmosphere_button_names = names
 
     # Download queue callbacks
     def _on_queue_download_queued(self, url: str, display_name: str) -> None:
@@ -2664,6 +3031,7 @@ class EnvironmentLauncher(QMainWindow):
         This is called when the download queue empties and we have a pending
         atmosphere config waiting to start.
         """
+        from engines import stop_all_atmosphere
         self.immersive_status.set_message("Downloads complete, starting atmosphere...", timeout_ms=2000)
 
         # NOW stop the previous atmosphere/lights (they were kept running during downloads)
@@ -2795,11 +3163,14 @@ engines:
 
         # Add to config_to_category mapping
         self.config_to_category[config["name"]] = category
+        self.specs[config["name"]] = ButtonSpec.from_config(config)
 
         # Add to url_to_config mapping
         sound_file = config.get("engines", {}).get("sound", {}).get("file", "")
         if sound_file:
             self.url_to_config[sound_file] = config
+            if sound_file in self.active_atmosphere_urls:
+                self._refresh_atmosphere_button_names()
 
         # Find or create the category tab
         is_new_category = category not in self.category_content_widgets
@@ -2810,23 +3181,22 @@ engines:
             scroll_area = self._create_category_tab(category, [config])
 
             # Add to category list
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 50))
-            self.category_list.addItem(item)
+            row = self.category_model.append_category(category)
 
-            # Create and set custom widget for this item
+            # Create and set custom widget for this row
             category_widget = CategoryItemWidget(category)
             category_widget.lights_clicked.connect(self._on_lights_badge_clicked)
             category_widget.atmosphere_clicked.connect(self._on_atmosphere_badge_clicked)
-            self.category_list.setItemWidget(item, category_widget)
+            self.category_list.setIndexWidget(self.category_model.index(row, 0), category_widget)
             self.category_widgets[category] = category_widget
 
             # Add to stack
             self.category_stack.addWidget(scroll_area)
             self.category_content_widgets[category] = scroll_area
+            self._tab_built.append(True)
 
             # Update tab_configs for the new category
-            new_tab_index = self.category_list.count() - 1
+            new_tab_index = self.category_stack.count() - 1
             self.tab_configs[new_tab_index] = [config]
 
             # Ensure visible
@@ -2841,6 +3211,10 @@ engines:
             if tab_index >= 0 and tab_index in self.tab_configs:
                 self.tab_configs[tab_index].append(config)
 
+            # Page not built yet - the button is created when it is first shown
+            if 0 <= tab_index < len(self._tab_built) and not self._tab_built[tab_index]:
+                return
+
             # Calculate shortcut key based on position in tab
             shortcut_key = ""
             if tab_index >= 0 and tab_index in self.tab_configs:
@@ -2851,6 +3225,7 @@ engines:
             container, btn = self._create_button(config, shortcut_key)
             name = config["name"]
             self.buttons[name] = btn
+            self._button_to_name[id(btn)] = name
 
             # Add button to existing grid
             content_widget = scroll_area.widget()
@@ -2871,9 +3246,9 @@ engines:
                 scroll_area.viewport().update()
 
             # Refresh shortcuts if this is current tab
-            current_tab_index = self.category_list.currentRow()
+            current_tab_index = self.category_stack.currentIndex()
             if current_tab_index == tab_index:
-                self._update_shortcuts_for_tab(tab_index)
+                self._update_shortcuts_for_tab(tab_index, force=True)
 
     def _force_category_repaint(self, category: str) -> None:
         """Force a repaint of a category's content widget."""
@@ -3014,45 +3389,23 @@ engines:
 
     def _update_atmosphere_buttons(self, urls: List[str], active: bool) -> None:
         """Highlight or unhighlight buttons for atmosphere member sounds."""
-        stale_buttons = []
         for url in urls:
             config = self.url_to_config.get(url)
             if config:
                 config_name = config.get("name")
-                if config_name and config_name in self.buttons:
-                    try:
-                        btn = self.buttons[config_name]
-                        if active:
-                            btn.setStyleSheet(self.ATMOSPHERE_ACTIVE_STYLE)
-                        else:
-                            btn.setStyleSheet(self.INACTIVE_STYLE)
-                        btn.update()  # Force visual refresh
-                    except RuntimeError:
-                        stale_buttons.append(config_name)
-        # Clean up stale button references
-        for name in stale_buttons:
-            if name in self.buttons:
-                del self.buttons[name]
+                if config_name:
+                    self._set_button_state(config_name, "atmosphere" if active else "inactive")
 
     def _clear_atmosphere_buttons(self) -> None:
         """Clear all atmosphere button highlights."""
-        stale_buttons = []
         for url in self.active_atmosphere_urls:
             config = self.url_to_config.get(url)
             if config:
                 config_name = config.get("name")
-                if config_name and config_name in self.buttons:
-                    try:
-                        btn = self.buttons[config_name]
-                        btn.setStyleSheet(self.INACTIVE_STYLE)
-                        btn.update()  # Force visual refresh
-                    except RuntimeError:
-                        stale_buttons.append(config_name)
-        # Clean up stale button references
-        for name in stale_buttons:
-            if name in self.buttons:
-                del self.buttons[name]
+                if config_name:
+                    self._set_button_state(config_name, "inactive")
         self.active_atmosphere_urls.clear()
+        self._atmosphere_button_names.clear()
         self._update_category_badges()
 
     def _toggle_loop_sound(self, config: Dict[str, Any]) -> None:
@@ -3070,11 +3423,8 @@ engines:
             atmosphere_engine = AtmosphereEngine()
             atmosphere_engine.stop_single(sound_url, fade_out=True)
             self.active_atmosphere_urls.discard(sound_url)
-            if config_name in self.buttons:
-                try:
-                    self.buttons[config_name].setStyleSheet(self.INACTIVE_STYLE)
-                except RuntimeError:
-                    del self.buttons[config_name]
+            self._refresh_atmosphere_button_names()
+            self._set_button_state(config_name, "inactive")
             self.immersive_status.set_message(f"Removed: {config_name}", timeout_ms=2000)
             self._update_category_badges()
 
@@ -3095,11 +3445,8 @@ engines:
             volume = self.atmosphere_volumes.get(sound_url, 100)
             if atmosphere_engine.start_single(sound_url, volume=volume, fade_in=True):
                 self.active_atmosphere_urls.add(sound_url)
-                if config_name in self.buttons:
-                    try:
-                        self.buttons[config_name].setStyleSheet(self.ATMOSPHERE_ACTIVE_STYLE)
-                    except RuntimeError:
-                        del self.buttons[config_name]
+                self._refresh_atmosphere_button_names()
+                self._set_button_state(config_name, "atmosphere")
                 self.immersive_status.set_message(f"Added: {config_name}", timeout_ms=2000)
                 self._update_category_badges()
 
@@ -3131,6 +3478,7 @@ engines:
     def _on_atmosphere_urls_selected(self, selected_urls: list) -> None:
         """Handle atmosphere_urls_selected signal - update tracking and button highlights."""
         self.active_atmosphere_urls = set(selected_urls)
+        self._refresh_atmosphere_button_names()
         self._update_atmosphere_buttons(selected_urls, active=True)
         self._update_category_badges()
 
@@ -3150,30 +3498,6 @@ engines:
         self.search_bar.environment_selected.connect(self._on_search_selected)
         # Only focus search bar when clicked or via Ctrl+L, not by default
         self.search_bar.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
-        if self.is_dark_mode:
-            self.search_bar.setStyleSheet("""
-                QLineEdit {
-                    padding: 6px 10px;
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    background-color: #2d2d2d;
-                    color: white;
-                }
-                QLineEdit:focus {
-                    border: 2px solid #4CAF50;
-                }
-            """)
-        else:
-            self.search_bar.setStyleSheet("""
-                QLineEdit {
-                    padding: 6px 10px;
-                    border: 1px solid #ccc;
-                    border-radius: 4px;
-                }
-                QLineEdit:focus {
-                    border: 2px solid #4CAF50;
-                }
-            """)
         search_label = QLabel("🔍")
         search_label.setStyleSheet("font-size: 16px;")
         search_layout.addWidget(search_label)
@@ -3191,53 +3515,13 @@ engines:
         self.splitter = QSplitter(Qt.Orientation.Horizontal)
 
         # Left side: category list (15% width)
-        self.category_list = QListWidget()
+        self.category_list = CategoryListView()
+        self.category_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.category_list.setMinimumWidth(120)
         self.category_list.setMaximumWidth(200)
 
-        # Style based on dark mode
-        if self.is_dark_mode:
-            self.category_list.setStyleSheet("""
-                QListWidget {
-                    font-size: 14px;
-                    padding: 5px;
-                    background-color: #2d2d2d;
-                    border: none;
-                }
-                QListWidget::item {
-                    padding: 10px 8px;
-                    border-radius: 4px;
-                    margin: 2px 4px;
-                    color: white;
-                }
-                QListWidget::item:selected {
-                    background-color: #4CAF50;
-                    color: white;
-                }
-                QListWidget::item:hover:!selected {
-                    background-color: #404040;
-                }
-            """)
-        else:
-            self.category_list.setStyleSheet("""
-                QListWidget {
-                    font-size: 14px;
-                    padding: 5px;
-                    border: none;
-                }
-                QListWidget::item {
-                    padding: 10px 8px;
-                    border-radius: 4px;
-                    margin: 2px 4px;
-                }
-                QListWidget::item:selected {
-                    background-color: #4CAF50;
-                    color: white;
-                }
-                QListWidget::item:hover:!selected {
-                    background-color: #e0e0e0;
-                }
-            """)
+        # Style search bar and category list based on dark mode
+        self._apply_theme_styles()
 
         # Right side: stacked widget for category content
         self.category_stack = QStackedWidget()
@@ -3245,57 +3529,64 @@ engines:
         # Track category content widgets for dynamic button addition
         self.category_content_widgets = {}
 
+        # Category pages are built on first show; until then the stack holds a placeholder
+        self._tab_built: List[bool] = []
+        self._pending_category: Dict[int, tuple] = {}  # tab_index -> (category, configs)
+
         # Add categories with separator between environments and sounds
         tab_index = 0
         self.separator_row = -1  # Track separator position for navigation
         added_separator = False
-        for category, configs in self.configs.items():
-            # Skip hidden category
-            if category == "hidden":
-                continue
-
-            # Add separator before first sound category
-            if not added_separator and category in SOUND_CATEGORIES:
-                self.separator_row = self.category_list.count()
-                separator_item = QListWidgetItem("── SOUNDS ──")
-                separator_item.setSizeHint(QSize(0, 28))
-                separator_item.setFlags(Qt.ItemFlag.NoItemFlags)  # Non-selectable
-                separator_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                # Style the separator item directly
-                separator_item.setForeground(QColor("#888888"))
-                font = separator_item.font()
-                font.setBold(True)
-                font.setPointSize(9)
-                separator_item.setFont(font)
-                self.category_list.addItem(separator_item)
-                added_separator = True
-
-            # Create list item with custom widget
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 50))
-            self.category_list.addItem(item)
-
-            # Create and set custom widget for this item
-            category_widget = CategoryItemWidget(category)
-            category_widget.lights_clicked.connect(self._on_lights_badge_clicked)
-            category_widget.atmosphere_clicked.connect(self._on_atmosphere_badge_clicked)
-            self.category_list.setItemWidget(item, category_widget)
-            self.category_widgets[category] = category_widget
-
-            # Build config_to_category mapping
-            for config in configs:
-                self.config_to_category[config["name"]] = category
+        # Populate list and stack in one batch without intermediate repaints or signals
+        self.category_list.setUpdatesEnabled(False)
+        self.category_list.blockSignals(True)
+        self.category_stack.setUpdatesEnabled(False)
+        try:
+            # Sidebar rows: category names, with None marking the separator
+            rows: List[Optional[str]] = []
+            for category, configs in self.configs.items():
+                # Skip hidden category
+                if category == "hidden":
+                    continue
 
-            # Add content page
-            tab_widget = self._create_category_tab(category, configs)
-            self.category_stack.addWidget(tab_widget)
-            self.category_content_widgets[category] = tab_widget
-            self.tab_configs[tab_index] = configs
-            tab_index += 1
+                # Add separator before first sound category
+                if not added_separator and category in SOUND_CATEGORIES:
+                    self.separator_row = len(rows)
+                    rows.append(None)
+                    added_separator = True
+                rows.append(category)
+
+                # Build config_to_category mapping
+                for config in configs:
+                    self.config_to_category[config["name"]] = category
+
+                # Add placeholder content page (built lazily in _ensure_tab_built)
+                placeholder = QWidget()
+                self.category_stack.addWidget(placeholder)
+                self.category_content_widgets[category] = placeholder
+                self.tab_configs[tab_index] = configs
+                self._tab_built.append(False)
+                self._pending_category[tab_index] = (category, configs)
+                tab_index += 1
+
+            # One model for all rows, then a custom widget per category row
+            self.category_model = CategoryListModel(rows, self.category_list)
+            self.category_list.setModel(self.category_model)
+            for row, category in enumerate(rows):
+                if category is None:
+                    continue
+                category_widget = CategoryItemWidget(category)
+                category_widget.lights_clicked.connect(self._on_lights_badge_clicked)
+                category_widget.atmosphere_clicked.connect(self._on_atmosphere_badge_clicked)
+                self.category_list.setIndexWidget(self.category_model.index(row, 0), category_widget)
+                self.category_widgets[category] = category_widget
+        finally:
+            self.category_stack.setUpdatesEnabled(True)
+            self.category_list.blockSignals(False)
+            self.category_list.setUpdatesEnabled(True)
 
-        # Connect list selection to stack - use custom handler to look up by category name
+        # Connect list selection to stack and shortcuts - a single slot handles both
         self.category_list.currentRowChanged.connect(self._on_tab_changed)
-        self.category_list.currentRowChanged.connect(self._switch_to_category_at_row)
 
         # Select first category
         self.category_list.setCurrentRow(0)
@@ -3390,9 +3681,18 @@ engines:
 
         # Content widget inside scroll area
         content_widget = QWidget()
+        content_widget.setUpdatesEnabled(False)
         layout = QGridLayout()
         layout.setSpacing(10)
 
+        # Reserve the grid's rows/columns up front (only columns actually used,
+        # so categories with fewer than 4 buttons keep full-width buttons)
+        n = len(configs)
+        for r in range((n + 3) // 4):
+            layout.setRowStretch(r, 1)
+        for c in range(min(n, 4)):
+            layout.setColumnStretch(c, 1)
+
         # Create buttons in a grid (4 columns)
         for idx, config in enumerate(configs):
             row = idx // 4
@@ -3407,8 +3707,10 @@ engines:
 
             # Store button reference for styling
             self.buttons[config["name"]] = btn
+            self._button_to_name[id(btn)] = config["name"]
 
         content_widget.setLayout(layout)
+        content_widget.setUpdatesEnabled(True)
         scroll_area.setWidget(content_widget)
         return scroll_area
 
@@ -3433,6 +3735,7 @@ engines:
         escape_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
         escape_shortcut.activated.connect(self._clear_search)
 
+        # Per-tab button shortcuts are dispatched from keyPressEvent via _key_to_config
         # Setup initial shortcuts for first tab
         self._update_shortcuts_for_tab(0)
 
@@ -3455,69 +3758,100 @@ engines:
         self.category_list.setCurrentRow(prev_row)
 
     def _on_tab_changed(self, index: int) -> None:
-        """Handle tab change - remap keyboard shortcuts."""
-        # Skip if this is the separator row
-        if index == self.separator_row:
+        """Handle tab change - show the category page and remap keyboard shortcuts."""
+        # Skip if this is the separator row (or nothing is selected)
+        if index < 0 or index == self.separator_row:
             return
 
-        # Compute tab_config index by subtracting 1 if past the separator
+        # Compute tab_config index by subtracting 1 if past the separator;
+        # stack pages are in the same order as tab_configs
         tab_index = index
         if self.separator_row >= 0 and index > self.separator_row:
             tab_index = index - 1
 
+        self._ensure_tab_built(tab_index)
+        self.category_stack.setCurrentIndex(tab_index)
         self._update_shortcuts_for_tab(tab_index)
 
-    def _switch_to_category_at_row(self, row: int) -> None:
-        """Switch the stack widget to show the category at the given list row."""
-        # Get the category name from the list item widget
-        item = self.category_list.item(row)
-        if not item:
-            return
-
-        category_widget = self.category_list.itemWidget(item)
-        if not category_widget or not isinstance(category_widget, CategoryItemWidget):
+    def _ensure_tab_built(self, tab_index: int) -> None:
+        """Build a category page in place of its placeholder on first show."""
+        if tab_index >= len(self._tab_built) or self._tab_built[tab_index]:
             return
+        category, configs = self._pending_category.pop(tab_index)
+
+        tab_widget = self._create_category_tab(category, configs)
+        placeholder = self.category_stack.widget(tab_index)
+        self.category_stack.removeWidget(placeholder)
+        self.category_stack.insertWidget(tab_index, tab_widget)
+        placeholder.deleteLater()
+        self.category_content_widgets[category] = tab_widget
+        self._tab_built[tab_index] = True
+
+        # Bring the new buttons in line with the current highlight state
+        for config in configs:
+            name = config["name"]
+            if name == self._active_button_name:
+                self._set_button_state(name, "active")
+            elif name in self._atmosphere_button_names:
+                self._set_button_state(name, "atmosphere")
 
-        category = category_widget.category
+    def _update_shortcuts_for_tab(self, tab_index: int, force: bool = False) -> None:
+        """Update keyboard shortcuts to point to current tab's buttons.
 
-        # Find the content widget for this category and switch to it
-        if category in self.category_content_widgets:
-            content_widget = self.category_content_widgets[category]
-            stack_index = self.category_stack.indexOf(content_widget)
-            if stack_index >= 0:
-                self.category_stack.setCurrentIndex(stack_index)
-
-    def _update_shortcuts_for_tab(self, tab_index: int) -> None:
-        """Update keyboard shortcuts to point to current tab's buttons."""
-        # Clear existing shortcuts
-        for shortcut in self.shortcuts:
-            shortcut.setEnabled(False)
-            shortcut.deleteLater()
-        self.shortcuts.clear()
+        Args:
+            tab_index: Index into tab_configs
+            force: Rewire even if the shortcuts already point at this tab
+                   (e.g. after a config was added to it)
+        """
+        if tab_index == self._last_tab_index and not force:
+            return
 
         # Get configs for this tab
         configs = self.tab_configs.get(tab_index, [])
 
-        # Create shortcuts for each button in this tab
-        for idx, config in enumerate(configs):
-            if idx >= len(self.KEYS):
-                break
-            key = self.KEYS[idx]
-            shortcut = QShortcut(QKeySequence(key), self)
+        # Map each shortcut key to this tab's config at the same position
+        self._key_to_config = {
+            Qt.Key[f"Key_{key}"].value: config
+            for key, config in zip(self.KEYS, configs)
+        }
+        self._last_tab_index = tab_index
 
-            # Check if this is a loop-capable sound
-            is_loop = config.get("metadata", {}).get("loop", False) or \
-                      config.get("engines", {}).get("sound", {}).get("loop", False)
+    def _get_spotify_engine(self) -> "SpotifyEngine":
+        """Get the shared SpotifyEngine, authenticating on first use.
 
-            if is_loop:
-                shortcut.activated.connect(
-                    lambda c=config: self._toggle_loop_sound(c)
-                )
-            else:
-                shortcut.activated.connect(
-                    lambda c=config: self._start_environment(c)
-                )
-            self.shortcuts.append(shortcut)
+        Raises whatever SpotifyEngine() raises (e.g. missing .spotify.ini);
+        a failed attempt is not cached so the next call retries.
+        """
+        from engines import SpotifyEngine
+        with self._spotify_engine_lock:
+            if self._spotify_engine is None:
+                self._spotify_engine = SpotifyEngine()
+            return self._spotify_engine
+
+    def _button_spec(self, config: Dict[str, Any]) -> ButtonSpec:
+        """Get the precomputed ButtonSpec for a config, building it if missing."""
+        spec = self.specs.get(config["name"])
+        if spec is None:
+            spec = self.specs[config["name"]] = ButtonSpec.from_config(config)
+        return spec
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _emoji_mask(sound: bool, spotify: bool, atmosphere: bool, lights: bool, loop: bool) -> Tuple[Tuple[str, str], ...]:
+        """Get the (kind, emoji) badges to show for a combination of enabled engines."""
+        enabled = {
+            "sound": sound,
+            "spotify": spotify,
+            "atmosphere": atmosphere,
+            "lights": lights,
+            "loop": loop,
+        }
+        is_sound_only = sound and not spotify and not atmosphere and not lights
+        return tuple(
+            (kind, sound_only_emoji if sound_only_emoji and is_sound_only else emoji)
+            for kind, emoji, sound_only_emoji in EnvironmentLauncher._BADGE_SPECS
+            if enabled[kind]
+        )
 
     def _generate_pastel_color(self) -> str:
         """Generate a random pastel color as hex string."""
@@ -3533,23 +3867,24 @@ engines:
         Returns:
             Tuple of (container_widget, button) - container for layout, button for styling
         """
-        name = config["name"]
-        description = config.get("description", "")
+        spec = self._button_spec(config)
+        name = spec.name
+        description = spec.description
 
         # Determine which engines are enabled
-        sound_enabled = config.get("engines", {}).get("sound", {}).get("enabled", False)
-        spotify_enabled = config.get("engines", {}).get("spotify", {}).get("enabled", False)
-        atmosphere_enabled = config.get("engines", {}).get("atmosphere", {}).get("enabled", False)
-        lights_enabled = config.get("engines", {}).get("lights", {}).get("enabled", False)
+        sound_enabled = spec.sound_enabled
+        spotify_enabled = spec.spotify_enabled
+        atmosphere_enabled = spec.atmosphere_enabled
+        lights_enabled = spec.lights_enabled
         # Check if this is a loop-capable sound (can be mixed into atmosphere)
-        is_loop = config.get("metadata", {}).get("loop", False) or config.get("engines", {}).get("sound", {}).get("loop", False)
+        is_loop = spec.is_loop
 
         # Get optional icon emoji from config
-        icon_emoji = config.get("icon", "")
+        icon_emoji = spec.icon
 
         # Button shows only the name (larger font) with background icon
         btn = IconButton(name, icon_emoji)
-        btn.setStyleSheet(self.INACTIVE_STYLE)
+        self._button_state.pop(name, None)
         btn.setToolTip(description)
         # Loop sounds toggle in/out of atmosphere; other configs start environment
         if is_loop:
@@ -3574,8 +3909,7 @@ engines:
             desc_label = QLabel(description)
             desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             desc_label.setWordWrap(True)
-            desc_style = self.DESC_STYLE_DARK if self.is_dark_mode else self.DESC_STYLE
-            desc_label.setStyleSheet(desc_style)
+            desc_label.setObjectName("env_desc")  # Styled by the window stylesheet
 
         # Create emoji indicator row (will be parented to container)
         emoji_row = QWidget()
@@ -3584,54 +3918,14 @@ engines:
         emoji_layout.setSpacing(4)
         emoji_layout.addStretch()
 
-        # Pastel colors for each indicator
-        is_sound_only = sound_enabled and not spotify_enabled and not atmosphere_enabled and not lights_enabled
-
-        if sound_enabled:
-            sound_emoji = "📢" if is_sound_only else "🔊"
-            sound_label = QLabel(sound_emoji)
-            sound_label.setFixedHeight(18)
-            sound_label.setStyleSheet(
-                "background-color: #FFCBA4; padding: 0px 6px; border: 1px solid gray; border-radius: 3px; font-size: 14px; color: black;"
-            )
-            sound_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            emoji_layout.addWidget(sound_label)
-
-        if spotify_enabled:
-            spotify_label = QLabel("🎵")
-            spotify_label.setFixedHeight(18)
-            spotify_label.setStyleSheet(
-                "background-color: #B4F0A8; padding: 0px 6px; border: 1px solid gray; border-radius: 3px; font-size: 14px; color: black;"
-            )
-            spotify_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            emoji_layout.addWidget(spotify_label)
-
-        if atmosphere_enabled:
-            atmosphere_label = QLabel("🌊")
-            atmosphere_label.setFixedHeight(18)
-            atmosphere_label.setStyleSheet(
-                "background-color: #B4E8F0; padding: 0px 6px; border: 1px solid gray; border-radius: 3px; font-size: 14px; color: black;"
-            )
-            atmosphere_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            emoji_layout.addWidget(atmosphere_label)
-
-        if lights_enabled:
-            lights_label = QLabel("💡")
-            lights_label.setFixedHeight(18)
-            lights_label.setStyleSheet(
-                "background-color: #FFF9B0; padding: 0px 6px; border: 1px solid gray; border-radius: 3px; font-size: 14px; color: black;"
-            )
-            lights_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            emoji_layout.addWidget(lights_label)
-
-        if is_loop:
-            loop_label = QLabel("🔁")
-            loop_label.setFixedHeight(18)
-            loop_label.setStyleSheet(
-                "background-color: #E0B4F0; padding: 0px 6px; border: 1px solid gray; border-radius: 3px; font-size: 14px; color: black;"
-            )
-            loop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            emoji_layout.addWidget(loop_label)
+        # One badge per enabled engine (colors come from BADGE_STYLE)
+        badges = self._emoji_mask(sound_enabled, spotify_enabled, atmosphere_enabled, lights_enabled, is_loop)
+        for kind, emoji in badges:
+            badge_label = QLabel(emoji)
+            badge_label.setObjectName(f"badge_{kind}")
+            badge_label.setFixedHeight(18)
+            badge_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            emoji_layout.addWidget(badge_label)
 
         emoji_layout.addStretch()
         emoji_row.setLayout(emoji_layout)
@@ -3655,6 +3949,7 @@ engines:
 
     def _start_environment(self, config: Dict[str, Any]) -> None:
         """Start an environment."""
+        from engines import stop_all_atmosphere, stop_all_sounds
         # Clear pending search button since we're starting an environment
         self._pending_search_button = None
 
@@ -3670,7 +3965,7 @@ engines:
         # If so, keep current lights/atmosphere running until downloads complete
         if has_atmosphere:
             try:
-                SpotifyEngine().stop()
+                self._get_spotify_engine().stop()
             except Exception:
                 pass  # Spotify may not be configured
 
@@ -3754,7 +4049,7 @@ engines:
 
         # Create and start runner
         try:
-            runner = EngineRunner(config)
+            runner = EngineRunner(config, self._get_spotify_engine)
             runner.error_occurred.connect(self._on_error)
             runner.status_update.connect(self._on_status_update)
             runner.finished.connect(lambda: self._on_runner_finished(runner))
@@ -3837,42 +4132,58 @@ engines:
         if set_warm_white:
             self._set_lights_warm_white()
 
-    def _set_lights_warm_white(self) -> None:
-        """Set all configured lights to soft warm white at full brightness."""
-        import asyncio
+    def _get_lights_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the persistent event loop used for one-off bulb commands, starting it if needed."""
+        if self._lights_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            self._lights_loop = loop
+        return self._lights_loop
+
+    def _set_lights_warm_white(self, wait: bool = False) -> None:
+        """Set all configured lights to soft warm white at full brightness.
+
+        Args:
+            wait: If True, block until the bulbs have been updated (or timed out).
+                  Otherwise the update runs in the background.
+        """
         from pywizlight import wizlight, PilotBuilder
 
         # Skip if lights disabled for this session
         if self._lights_disabled_this_session:
             return
 
-        wizbulb_config = WizBulbConfigManager()
-        if wizbulb_config.is_configured():
-            all_ips = []
-            for group in ["backdrop_bulbs", "overhead_bulbs", "battlefield_bulbs"]:
-                ips = wizbulb_config.get(group, "").split()
-                all_ips.extend([ip.strip() for ip in ips if ip.strip()])
-
-            if all_ips:
-                async def set_lights_soft_white():
-                    # Soft warm white at max brightness: ~2700K equivalent
-                    pilot = PilotBuilder(rgb=(255, 244, 229), brightness=255)
-                    tasks = []
-                    for ip in all_ips:
-                        async def set_bulb(bulb_ip):
-                            try:
-                                bulb = wizlight(bulb_ip)
-                                await asyncio.wait_for(bulb.turn_on(pilot), timeout=2.0)
-                            except:
-                                pass  # Ignore unreachable bulbs or timeouts
-                        tasks.append(set_bulb(ip))
-                    # Run all bulb commands concurrently with overall timeout
-                    await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=5.0)
+        all_ips = self.wizbulb_config.get_all_ips_cached()
+        if all_ips:
+            bulbs = self._warm_white_bulbs
 
+            async def set_bulb(bulb_ip, pilot):
                 try:
-                    asyncio.run(set_lights_soft_white())
+                    # Bulbs are bound to the lights loop, so reuse them across calls
+                    bulb = bulbs.get(bulb_ip)
+                    if bulb is None:
+                        bulb = bulbs[bulb_ip] = wizlight(bulb_ip)
+                    await asyncio.wait_for(bulb.turn_on(pilot), timeout=2.0)
                 except:
-                    pass
+                    pass  # Ignore unreachable bulbs or timeouts
+
+            async def set_lights_soft_white():
+                # Soft warm white at max brightness: ~2700K equivalent
+                pilot = PilotBuilder(rgb=(255, 244, 229), brightness=255)
+                # Run all bulb commands concurrently with overall timeout
+                await asyncio.wait_for(
+                    asyncio.gather(*(set_bulb(ip, pilot) for ip in all_ips), return_exceptions=True),
+                    timeout=5.0
+                )
+
+            try:
+                future = asyncio.run_coroutine_threadsafe(
+                    set_lights_soft_white(), self._get_lights_loop()
+                )
+                if wait:
+                    future.result(timeout=6.0)
+            except:
+                pass
 
     def _stop_current(self) -> None:
         """Stop all running environments (lights)."""
@@ -3885,15 +4196,18 @@ engines:
 
     def _stop_sounds(self) -> None:
         """Stop all playing sound effects."""
+        from engines import stop_all_sounds
         stopped = stop_all_sounds()
-        self.immersive_status.clear_sound()
-        if stopped > 0:
-            self.immersive_status.set_message(f"Stopped {stopped} sound(s)", timeout_ms=3000)
-        else:
-            self.immersive_status.set_message("No sounds playing", timeout_ms=3000)
+        with self.immersive_status.bulk_update():
+            self.immersive_status.clear_sound()
+            if stopped > 0:
+                self.immersive_status.set_message(f"Stopped {stopped} sound(s)", timeout_ms=3000)
+            else:
+                self.immersive_status.set_message("No sounds playing", timeout_ms=3000)
 
     def _stop_atmosphere_and_spotify(self) -> None:
         """Stop both Spotify and atmosphere playback."""
+        from engines import stop_all_atmosphere
         stopped_any = False
 
         # Stop atmosphere sounds
@@ -3905,17 +4219,18 @@ engines:
 
         # Stop Spotify
         try:
-            spotify_engine = SpotifyEngine()
+            spotify_engine = self._get_spotify_engine()
             if spotify_engine.stop():
                 stopped_any = True
         except Exception:
             pass  # Spotify may not be configured
 
-        self.immersive_status.clear_music()
-        if stopped_any:
-            self.immersive_status.set_message("Atmosphere stopped", timeout_ms=3000)
-        else:
-            self.immersive_status.set_message("No atmosphere playing", timeout_ms=3000)
+        with self.immersive_status.bulk_update():
+            self.immersive_status.clear_music()
+            if stopped_any:
+                self.immersive_status.set_message("Atmosphere stopped", timeout_ms=3000)
+            else:
+                self.immersive_status.set_message("No atmosphere playing", timeout_ms=3000)
 
     def _focus_search(self) -> None:
         """Focus the search bar."""
@@ -4021,6 +4336,15 @@ engines:
 
     def _on_atmosphere_badge_clicked(self, category: str) -> None:
         """Handle click on atmosphere badge - navigate to first atmosphere button in category."""
+        # Make sure the category's buttons exist before looking them up
+        category_index = self._get_category_index(category)
+        if category_index < 0:
+            return
+        stack_index = category_index
+        if self.separator_row >= 0 and category_index > self.separator_row:
+            stack_index = category_index - 1
+        self._ensure_tab_built(stack_index)
+
         # Find atmosphere URLs in this category
         atmosphere_buttons_in_category = []
         for url in self.active_atmosphere_urls:
@@ -4034,17 +4358,8 @@ engines:
         if not atmosphere_buttons_in_category:
             return
 
-        # Find the category index
-        category_index = self._get_category_index(category)
-        if category_index < 0:
-            return
-
         # Switch to that category
         self.category_list.setCurrentRow(category_index)
-        # Stack index needs to account for separator (list has separator, stack doesn't)
-        stack_index = category_index
-        if self.separator_row >= 0 and category_index > self.separator_row:
-            stack_index = category_index - 1
         self.category_stack.setCurrentIndex(stack_index)
 
         # Scroll to and pulse the first atmosphere button
@@ -4054,11 +4369,7 @@ engines:
 
     def _get_category_index(self, category: str) -> int:
         """Get the list index for a category name."""
-        for i in range(self.category_list.count()):
-            widget = self.category_list.itemWidget(self.category_list.item(i))
-            if isinstance(widget, CategoryItemWidget) and widget.category == category:
-                return i
-        return -1
+        return self.category_model.row_of(category)
 
     def _update_category_badges(self) -> None:
         """Update all category badges based on current lights and atmosphere state."""
@@ -4094,64 +4405,65 @@ engines:
         self.immersive_status.set_message(f"Found: {config_name} (press Enter to activate)", timeout_ms=5000)
 
     def _pulse_button(self, btn: QPushButton) -> None:
-        """Make a button pulse with a green border glow for 3 seconds."""
+        """Make a button pulse with a green glow, 4 quick pulses."""
         # Find the config name for this button
-        btn_config_name = None
-        for name, b in self.buttons.items():
-            if b is btn:
-                btn_config_name = name
-                break
+        btn_config_name = self._button_to_name.get(id(btn))
 
-        # Pulse styles - border expands with color getting brighter, 3 quick pulses
-        # Border grows 1→6→1, color goes dark→bright→dark, radius shrinks as border grows
-        single_pulse = [
-            "border: 1px solid #004400; border-radius: 3px; padding: 8px; font-size: 17px;",
-            "border: 2px solid #005500; border-radius: 3px; padding: 8px; font-size: 17px;",
-            "border: 3px solid #007700; border-radius: 2px; padding: 8px; font-size: 17px;",
-            "border: 4px solid #009900; border-radius: 2px; padding: 8px; font-size: 17px;",
-            "border: 5px solid #00CC00; border-radius: 1px; padding: 8px; font-size: 17px;",
-            "border: 6px solid #00FF00; border-radius: 1px; padding: 8px; font-size: 17px;",
-            "border: 5px solid #00CC00; border-radius: 1px; padding: 8px; font-size: 17px;",
-            "border: 4px solid #009900; border-radius: 2px; padding: 8px; font-size: 17px;",
-            "border: 3px solid #007700; border-radius: 2px; padding: 8px; font-size: 17px;",
-            "border: 2px solid #005500; border-radius: 3px; padding: 8px; font-size: 17px;",
-        ]
-        # Repeat 4 times
-        pulse_styles = single_pulse * 4
+        # Restart if the button is already pulsing
+        previous = getattr(btn, "_pulse_animation", None)
+        if previous is not None:
+            try:
+                previous.stop()
+            except RuntimeError:
+                pass
 
-        # Create pulse animation using timers
-        pulse_count = [0]
-        total_pulses = len(pulse_styles)
+        # Glow grows 1→6→1 and brightens dark→bright→dark; animated by Qt, no stylesheet changes
+        effect = QGraphicsDropShadowEffect(btn)
+        effect.setOffset(0, 0)
+        effect.setBlurRadius(1)
+        effect.setColor(QColor("#004400"))
+        btn.setGraphicsEffect(effect)
+
+        anim = QVariantAnimation(btn)
+        anim.setStartValue(1)
+        anim.setKeyValueAt(0.5, 6)
+        anim.setEndValue(1)
+        anim.setDuration(200)
+        anim.setLoopCount(4)
+        btn._pulse_animation = anim
+
+        def on_value(value):
+            try:
+                effect.setBlurRadius(value * 3)
+                effect.setColor(QColor.fromHsv(120, 255, 68 + value * 30))
+            except RuntimeError:
+                # Effect was replaced or button deleted during the animation
+                pass
 
-        def do_pulse():
+        def on_finished():
             try:
-                if pulse_count[0] < total_pulses:
-                    btn.setStyleSheet(pulse_styles[pulse_count[0]])
-                    pulse_count[0] += 1
-                    QTimer.singleShot(20, do_pulse)  # ~0.6 seconds total for 3 pulses
-                else:
-                    # Restore appropriate style based on button state
-                    if btn_config_name and btn_config_name == self.lights_config_name:
-                        # Active lights button
-                        btn.setStyleSheet(self.ACTIVE_STYLE)
-                    elif btn_config_name and self._is_atmosphere_button(btn_config_name):
-                        # Active atmosphere button
-                        btn.setStyleSheet(self.ATMOSPHERE_ACTIVE_STYLE)
-                    else:
-                        btn.setStyleSheet(self.INACTIVE_STYLE)
+                btn.setGraphicsEffect(None)
+                btn._pulse_animation = None
+                # Restore appropriate style based on button state
+                if btn_config_name and btn_config_name == self.lights_config_name:
+                    # Active lights button
+                    self._set_button_state(btn_config_name, "active", force=True)
+                elif btn_config_name and self._is_atmosphere_button(btn_config_name):
+                    # Active atmosphere button
+                    self._set_button_state(btn_config_name, "atmosphere", force=True)
+                elif btn_config_name:
+                    self._set_button_state(btn_config_name, "inactive", force=True)
             except RuntimeError:
                 # Button was deleted during pulse animation, ignore
                 pass
 
-        do_pulse()
+        anim.valueChanged.connect(on_value)
+        anim.finished.connect(on_finished)
+        anim.start(QVariantAnimation.DeletionPolicy.DeleteWhenStopped)
 
     def _is_atmosphere_button(self, config_name: str) -> bool:
         """Check if a config is currently playing as an atmosphere sound."""
-        for url in self.active_atmosphere_urls:
-            config = self.url_to_config.get(url)
-            if config and config.get("name") == config_name:
-                return True
-        return False
+        return config_name in self._atmosphere_button_names
 
     def _cleanup_old_runner(self, runner: EngineRunner) -> None:
         """Remove finished runner from old runners list."""
@@ -4193,43 +4505,61 @@ engines:
             self._update_category_badges()
             self.stop_button.setEnabled(False)
 
+    def _set_button_state(self, name: str, state: str, force: bool = False) -> None:
+        """Apply a highlight state to a button, skipping buttons already in that state.
+
+        Args:
+            name: Config name of the button
+            state: One of "inactive", "active" or "atmosphere"
+            force: Re-apply the style even if the cached state matches
+        """
+        btn = self.buttons.get(name)
+        if btn is None:
+            return
+        if not force and self._button_state.get(name, "inactive") == state:
+            return
+        try:
+            # Re-polish so the window stylesheet re-matches the state selector
+            btn.setProperty("state", state)
+            style = btn.style()
+            style.unpolish(btn)
+            style.polish(btn)
+        except RuntimeError:
+            # Button was deleted, drop stale references
+            del self.buttons[name]
+            self._button_to_name.pop(id(btn), None)
+            self._button_state.pop(name, None)
+            return
+        if state == "inactive":
+            self._button_state.pop(name, None)
+        else:
+            self._button_state[name] = state
+
     def _update_active_button(self, active_name: str) -> None:
         """Highlight the active lights button, preserving atmosphere button styles."""
-        # Build set of active atmosphere button names
-        atmosphere_button_names = set()
-        for url in self.active_atmosphere_urls:
-            cfg = self.url_to_config.get(url)
-            if cfg:
-                atmosphere_button_names.add(cfg.get("name"))
+        self._active_button_name = active_name
 
-        stale_buttons = []
-        for name, btn in self.buttons.items():
-            try:
-                if name == active_name:
-                    btn.setStyleSheet(self.ACTIVE_STYLE)
-                elif name in atmosphere_button_names:
-                    # Keep atmosphere members blue
-                    btn.setStyleSheet(self.ATMOSPHERE_ACTIVE_STYLE)
-                else:
-                    btn.setStyleSheet(self.INACTIVE_STYLE)
-            except RuntimeError:
-                # Button was deleted, mark for removal
-                stale_buttons.append(name)
+        # Desired non-inactive states; atmosphere members stay blue
+        new_state = {name: "atmosphere" for name in self._atmosphere_button_names}
+        new_state[active_name] = "active"
 
-        # Clean up stale button references
-        for name in stale_buttons:
-            del self.buttons[name]
+        # Only restyle buttons whose state actually changes
+        self.category_stack.setUpdatesEnabled(False)
+        try:
+            for name in set(new_state) | set(self._button_state):
+                self._set_button_state(name, new_state.get(name, "inactive"))
+        finally:
+            self.category_stack.setUpdatesEnabled(True)
 
     def _reset_button_styles(self) -> None:
         """Reset all buttons to inactive state."""
-        stale_buttons = []
-        for name, btn in list(self.buttons.items()):
-            try:
-                btn.setStyleSheet(self.INACTIVE_STYLE)
-            except RuntimeError:
-                stale_buttons.append(name)
-        for name in stale_buttons:
-            del self.buttons[name]
+        self._active_button_name = None
+        self.category_stack.setUpdatesEnabled(False)
+        try:
+            for name in list(self._button_state):
+                self._set_button_state(name, "inactive")
+        finally:
+            self.category_stack.setUpdatesEnabled(True)
 
     def keyPressEvent(self, event) -> None:
         """Handle key press events."""
@@ -4239,10 +4569,27 @@ engines:
                 self._pending_search_button.click()
                 self._pending_search_button = None
                 return
+        # Unmodified letter keys trigger the current tab's buttons
+        if event.modifiers() == Qt.KeyboardModifier.NoModifier:
+            config = self._key_to_config.get(event.key())
+            if config is not None:
+                if self._button_spec(config).is_loop:
+                    self._toggle_loop_sound(config)
+                else:
+                    self._start_environment(config)
+                return
         super().keyPressEvent(event)
 
     def closeEvent(self, event) -> None:
         """Handle window close event."""
+        if self._closing:
+            # Re-entered from _finalize_exit (or a repeated close while shutting down)
+            if self._exit_finalized:
+                event.accept()
+            else:
+                event.ignore()
+            return
+
         if self.lights_runner is not None and self.lights_runner.running:
             reply = QMessageBox.question(
                 self,
@@ -4252,21 +4599,39 @@ engines:
             )
 
             if reply == QMessageBox.StandardButton.Yes:
-                # On exit, actually wait for cleanup
-                self.lights_runner.running = False
-                if not self.lights_runner.wait(2000):
-                    self.lights_runner.terminate()
-                    self.lights_runner.wait(500)
-                self._cleanup_on_exit()
-                event.accept()
+                # Stop the lights and finish exiting once the runner thread is done,
+                # without blocking the event loop; terminate it if it takes over 2s
+                self._closing = True
+                self.lights_runner.finished.connect(self._finalize_exit)
+                self.lights_runner.stop()
+                QTimer.singleShot(2000, self._finalize_exit)
+                event.ignore()
             else:
                 event.ignore()
         else:
+            # Mark the shutdown first so a repeated close during cleanup is ignored
+            self._closing = True
             self._cleanup_on_exit()
+            self._exit_finalized = True
             event.accept()
 
+    def _finalize_exit(self) -> None:
+        """Finish closing after the lights runner has stopped (or timed out)."""
+        if self._exit_finalized:
+            return
+        self._exit_finalized = True
+
+        runner = self.lights_runner
+        if runner is not None and runner.isRunning():
+            runner.terminate()
+            runner.wait(500)
+
+        self._cleanup_on_exit()
+        self.close()
+
     def _cleanup_on_exit(self) -> None:
         """Cleanup actions when exiting the app."""
+        from engines import stop_all_atmosphere, stop_all_sounds
         # Shutdown download queue first (prevents new downloads during cleanup)
         try:
             if hasattr(self, '_download_queue') and self._download_queue:
@@ -4283,65 +4648,197 @@ engines:
         except:
             pass
 
-        # Stop Spotify playback
+        # Stop all playing sound effects
         try:
-            engine = SpotifyEngine()
-            engine.stop()
-            self.immersive_status.clear_music()
+            stop_all_sounds()
         except:
-            pass  # Spotify may not be configured
+            pass
 
-        # Stop atmosphere sounds
+        # Network/IO-bound stops run in parallel off the UI thread
+        def stop_spotify():
+            try:
+                engine = self._get_spotify_engine()
+                engine.stop()
+            except:
+                pass  # Spotify may not be configured
+
+        def stop_atmosphere():
+            try:
+                stop_all_atmosphere(fade_out=False)  # No fade on exit, just stop
+            except:
+                pass
+
+        def set_lights_warm_white():
+            # Set all lights to soft white (wait, the process is about to exit)
+            self._set_lights_warm_white(wait=True)
+
+        tasks = [stop_spotify, stop_atmosphere, set_lights_warm_white]
+
+        # Keep the event loop running while waiting (at most 1.5s), but without
+        # user input so nothing new can be started mid-shutdown
+        wait_loop = QEventLoop()
+        pending = [len(tasks)]
+
+        def on_task_done():
+            pending[0] -= 1
+            if pending[0] == 0:
+                wait_loop.quit()
+
+        self._exit_task_done.connect(on_task_done)
+        executor = ThreadPoolExecutor(max_workers=len(tasks))
+        for task in tasks:
+            executor.submit(task).add_done_callback(lambda _: self._exit_task_done.emit())
+        QTimer.singleShot(1500, wait_loop.quit)
+        wait_loop.exec(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+        self._exit_task_done.disconnect(on_task_done)
+        executor.shutdown(wait=False)
+
+        self.immersive_status.clear_music()
+
+
+def _dark_mode_cache_key() -> str:
+    """Build the validity key for a cached dark-mode result.
+
+    Combines the desktop name with the modification times of the files
+    backing the theme settings (dconf database for gsettings, kdeglobals).
+    """
+    import os
+
+    parts = [os.environ.get("XDG_CURRENT_DESKTOP", "")]
+    for path in (Path.home() / ".config" / "dconf" / "user",
+                 Path.home() / ".config" / "kdeglobals"):
         try:
-            stop_all_atmosphere(fade_out=False)  # No fade on exit, just stop
-        except:
-            pass
+            parts.append(str(path.stat().st_mtime_ns))
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
 
-        # Stop all playing sound effects
+
+def detect_system_dark_mode(settings_manager: Optional[SettingsManager] = None) -> bool:
+    """Detect if the system is using dark mode.
+
+    Args:
+        settings_manager: If given, the result is cached in settings and reused
+                          until the system theme files change.
+    """
+    cache_key = None
+    if settings_manager is not None:
+        cache_key = _dark_mode_cache_key()
+        cached = settings_manager.get_cached_dark_mode(cache_key)
+        if cached is not None:
+            return cached
+
+    is_dark = _detect_system_dark_mode_uncached()
+    if settings_manager is not None:
         try:
-            stop_all_sounds()
-        except:
+            settings_manager.set_cached_dark_mode(is_dark, cache_key)
+        except OSError:
             pass
+    return is_dark
+
+
+def _portal_color_scheme() -> Optional[int]:
+    """Read the freedesktop color-scheme preference from the XDG desktop portal.
+
+    Uses the optional jeepney D-Bus library.
+
+    Returns:
+        0 (no preference), 1 (prefer dark), 2 (prefer light), or None if unavailable
+    """
+    try:
+        from jeepney import DBusAddress, new_method_call
+        from jeepney.io.blocking import open_dbus_connection
+        from jeepney.wrappers import unwrap_msg
+    except ImportError:
+        return None
+
+    portal = DBusAddress(
+        "/org/freedesktop/portal/desktop",
+        bus_name="org.freedesktop.portal.Desktop",
+        interface="org.freedesktop.portal.Settings",
+    )
+    msg = new_method_call(portal, "Read", "ss", ("org.freedesktop.appearance", "color-scheme"))
+    try:
+        conn = open_dbus_connection(bus="SESSION")
+        try:
+            body = unwrap_msg(conn.send_and_get_reply(msg, timeout=1))
+        finally:
+            conn.close()
+    except Exception:
+        return None
 
-        # Set all lights to soft white
-        self._set_lights_warm_white()
+    # Read() returns the value wrapped in one or two variants, e.g. ('v', ('u', 1))
+    value = body[0] if body else None
+    while isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str):
+        value = value[1]
+    return value if isinstance(value, int) else None
 
 
-def detect_system_dark_mode() -> bool:
-    """Detect if the system is using dark mode."""
+def _gio_interface_theme() -> Optional[Tuple[str, str]]:
+    """Read GNOME's color-scheme and gtk-theme in-process via GIO (optional PyGObject).
+
+    Returns:
+        Tuple of (color_scheme, gtk_theme), or None if GIO or the schema is unavailable
+    """
+    try:
+        from gi.repository import Gio
+    except Exception:
+        return None
+
+    schema_id = "org.gnome.desktop.interface"
+    source = Gio.SettingsSchemaSource.get_default()
+    schema = source.lookup(schema_id, True) if source else None
+    if schema is None:
+        # Gio.Settings.new() aborts the process on a missing schema
+        return None
+    settings = Gio.Settings.new(schema_id)
+    color_scheme = settings.get_string("color-scheme") if schema.has_key("color-scheme") else ""
+    gtk_theme = settings.get_string("gtk-theme") if schema.has_key("gtk-theme") else ""
+    return color_scheme, gtk_theme
+
+
+def _detect_system_dark_mode_uncached() -> bool:
+    """Query the desktop environment for dark mode."""
     import subprocess
     import os
 
     # Check Linux GNOME/GTK dark mode
     if os.environ.get("XDG_CURRENT_DESKTOP"):
-        try:
-            result = subprocess.run(
-                ["gsettings", "get", "org.gnome.desktop.interface", "color-scheme"],
-                capture_output=True, text=True, timeout=1
-            )
-            if "dark" in result.stdout.lower():
-                return True
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
+        # XDG desktop portal (freedesktop standard, works across desktops)
+        color_scheme = _portal_color_scheme()
+        if color_scheme == 1:
+            return True
 
-        # Try GTK theme name as fallback
-        try:
-            result = subprocess.run(
-                ["gsettings", "get", "org.gnome.desktop.interface", "gtk-theme"],
-                capture_output=True, text=True, timeout=1
-            )
-            if "dark" in result.stdout.lower():
+        # GNOME settings read in-process
+        gio_theme = _gio_interface_theme()
+        if gio_theme is not None:
+            if any("dark" in value.lower() for value in gio_theme):
                 return True
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
+        elif color_scheme is None:
+            # Neither D-Bus nor GIO bindings available - fall back to the gsettings CLI
+            for key in ("color-scheme", "gtk-theme"):
+                try:
+                    result = subprocess.run(
+                        ["gsettings", "get", "org.gnome.desktop.interface", key],
+                        capture_output=True, text=True, timeout=1
+                    )
+                    if "dark" in result.stdout.lower():
+                        return True
+                except (subprocess.SubprocessError, FileNotFoundError):
+                    pass
 
     # Check KDE dark mode
     kde_globals = Path.home() / ".config" / "kdeglobals"
     if kde_globals.exists():
         try:
-            content = kde_globals.read_text()
-            if "ColorScheme" in content and "Dark" in content:
-                return True
+            # Stream the file and stop at the [General] ColorScheme entry
+            with kde_globals.open("r", encoding="utf-8", errors="ignore") as f:
+                in_general = False
+                for line in f:
+                    if line.startswith("["):
+                        in_general = line.strip() == "[General]"
+                    elif in_general and line.startswith("ColorScheme"):
+                        return "Dark" in line
         except Exception:
             pass
 
@@ -4375,6 +4872,27 @@ def apply_dark_palette(app: QApplication) -> None:
     app.setPalette(dark_palette)
 
 
+def _on_system_color_scheme_changed(app: QApplication, launcher: "EnvironmentLauncher",
+                                    settings_manager: SettingsManager, scheme) -> None:
+    """Re-apply the palette and launcher styles after the system theme changes."""
+    if scheme == Qt.ColorScheme.Dark:
+        is_dark = True
+    elif scheme == Qt.ColorScheme.Light:
+        is_dark = False
+    else:
+        is_dark = _detect_system_dark_mode_uncached()
+    try:
+        settings_manager.set_cached_dark_mode(is_dark, _dark_mode_cache_key())
+    except OSError:
+        pass
+
+    if is_dark:
+        apply_dark_palette(app)
+    else:
+        app.setPalette(app.style().standardPalette())
+    launcher.set_dark_mode(is_dark)
+
+
 def main():
     """Entry point for the application."""
     app = QApplication(sys.argv)
@@ -4389,11 +4907,20 @@ def main():
     theme = settings_manager.get_theme()
     if theme == "dark":
         apply_dark_palette(app)
-    elif theme == "system" and detect_system_dark_mode():
+    elif theme == "system" and detect_system_dark_mode(settings_manager):
         apply_dark_palette(app)
     # else: light mode, use default palette
 
     launcher = EnvironmentLauncher(settings_manager)
+
+    # Follow live system theme changes (Qt 6.5+ reports the portal's color-scheme)
+    if theme == "system":
+        style_hints = app.styleHints()
+        if hasattr(style_hints, "colorSchemeChanged"):
+            style_hints.colorSchemeChanged.connect(
+                lambda scheme: _on_system_color_scheme_changed(app, launcher, settings_manager, scheme)
+            )
+
     launcher.show()
     sys.exit(app.exec())
 
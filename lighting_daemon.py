@@ -41,11 +41,22 @@ class LightingDaemon:
         animation_running: Whether animation loop is active
     """
 
+    # Shared JSON codec instances (compact output, one line per message)
+    _encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    _decoder = json.JSONDecoder()
+
+    # Outbound message queue bound and max messages coalesced into one write
+    OUTBOX_SIZE = 256
+    MAX_BATCH = 32
+
     def __init__(self):
         """Initialize the lighting daemon."""
         self.lights_engine: Optional[LightsEngine] = None
         self.running = True
         self.animation_running = False
+        self._stdin_reader: Optional[asyncio.StreamReader] = None
+        self._out = sys.stdout.buffer
+        self._outbox: Optional[asyncio.Queue] = None  # Set while run() is active
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self) -> None:
@@ -60,6 +71,9 @@ class LightingDaemon:
             "type": "status",
             "message": "Received shutdown signal"
         })
+        # Wake the main loop if it is waiting on stdin
+        if self._stdin_reader is not None:
+            self._stdin_reader.feed_eof()
 
     def _send_response(self, response: Dict[str, Any]) -> None:
         """
@@ -69,14 +83,49 @@ class LightingDaemon:
             response: Dictionary to send as JSON
         """
         try:
-            json_str = json.dumps(response)
-            print(json_str, flush=True)
+            data = self._encoder.encode(response).encode("utf-8") + b"\n"
         except Exception as e:
             # Fallback if JSON encoding fails
-            print(json.dumps({
+            data = self._encoder.encode({
                 "type": "error",
                 "message": f"Failed to encode response: {str(e)}"
-            }), flush=True)
+            }).encode("utf-8") + b"\n"
+        if self._outbox is None:
+            # No writer task (startup/shutdown): write straight through
+            self._out.write(data)
+            self._out.flush()
+            return
+        try:
+            self._outbox.put_nowait(data)
+        except asyncio.QueueFull:
+            # Writer is behind: drain synchronously, keeping message order
+            self._flush_outbox(data)
+
+    def _flush_outbox(self, extra: bytes = b"") -> None:
+        """
+        Write all queued messages (plus an optional trailing one) in one write.
+
+        Args:
+            extra: Already-encoded message to append after the queued ones
+        """
+        chunks = []
+        while self._outbox is not None and not self._outbox.empty():
+            chunks.append(self._outbox.get_nowait())
+        if extra:
+            chunks.append(extra)
+        if chunks:
+            self._out.write(b"".join(chunks))
+            self._out.flush()
+
+    async def _writer(self) -> None:
+        """Drain the outbox, coalescing bursts of messages into a single write."""
+        outbox = self._outbox
+        while True:
+            chunks = [await outbox.get()]
+            while len(chunks) < self.MAX_BATCH and not outbox.empty():
+                chunks.append(outbox.get_nowait())
+            self._out.write(b"".join(chunks))
+            self._out.flush()
 
     def _send_error(self, message: str, exception: Optional[Exception] = None) -> None:
         """
@@ -195,7 +244,7 @@ class LightingDaemon:
             command_str: JSON command string
         """
         try:
-            command = json.loads(command_str)
+            command = self._decoder.decode(command_str)
         except json.JSONDecodeError as e:
             self._send_error(
                 f"Invalid JSON command: {command_str}",
@@ -240,6 +289,24 @@ class LightingDaemon:
 
         Reads commands from stdin and processes them until shutdown.
         """
+        # Single writer task owns stdout while the daemon runs
+        self._outbox = asyncio.Queue(maxsize=self.OUTBOX_SIZE)
+        writer_task = asyncio.create_task(self._writer())
+
+        try:
+            await self._serve()
+        finally:
+            writer_task.cancel()
+            try:
+                await writer_task
+            except asyncio.CancelledError:
+                pass
+            # Write anything the writer did not get to, then go back to direct writes
+            self._flush_outbox()
+            self._outbox = None
+
+    async def _serve(self) -> None:
+        """Initialize the lights engine and process commands until shutdown."""
         # Initialize lights engine
         if not await self._initialize_lights_engine():
             self._send_error("Daemon startup failed")
@@ -251,16 +318,28 @@ class LightingDaemon:
         })
 
         # Main command processing loop
-        loop = asyncio.get_event_loop()
-
         try:
+            # Read stdin through the event loop so commands wake us immediately
+            loop = asyncio.get_running_loop()
+            reader = asyncio.StreamReader()
+            try:
+                await loop.connect_read_pipe(
+                    lambda: asyncio.StreamReaderProtocol(reader),
+                    sys.stdin
+                )
+            except (ValueError, OSError):
+                # Regular files (e.g. "< commands.txt") can't be watched by the
+                # loop; read those with blocking readline calls in the executor
+                reader = None
+            self._stdin_reader = reader
+
+            # Route signals through the loop so a blocked readline is woken on shutdown
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(sig, self._handle_shutdown, sig, None)
+
             while self.running:
-                # Read command from stdin (non-blocking with timeout)
                 try:
-                    line = await asyncio.wait_for(
-                        loop.run_in_executor(None, sys.stdin.readline),
-                        timeout=0.1
-                    )
+                    line = await self._read_line(loop)
 
                     if not line:
                         # EOF reached
@@ -270,11 +349,6 @@ class LightingDaemon:
                     if line:
                         await self._process_command(line)
 
-                except asyncio.TimeoutError:
-                    # No input available, continue loop
-                    # This allows the animation task to run
-                    await asyncio.sleep(0.01)
-
                 except Exception as e:
                     self._send_error(
                         "Error reading command",
@@ -292,6 +366,13 @@ class LightingDaemon:
                 "message": "Lighting daemon shut down"
             })
 
+    async def _read_line(self, loop: asyncio.AbstractEventLoop) -> str:
+        """Read one line from stdin, returning an empty string at EOF."""
+        if self._stdin_reader is not None:
+            line = await self._stdin_reader.readline()
+            return line.decode("utf-8", errors="replace")
+        return await loop.run_in_executor(None, sys.stdin.readline)
+
 
 async def main():
     """Main entry point for lighting daemon."""
@@ -302,7 +383,7 @@ async def main():
     except KeyboardInterrupt:
         pass
     except Exception as e:
-        print(json.dumps({
+        print(LightingDaemon._encoder.encode({
             "type": "error",
             "message": f"Daemon crashed: {str(e)}",
             "exception_type": type(e).__name__
@@ -12,15 +12,71 @@ Usage:
         # sound is either a local file path or freesound URL
 """
 
+import logging
 import random
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+logger = logging.getLogger(__name__)
 
 SOUND_CONF_PREFIX = "sound_conf:"
 SOUND_CONF_DIR = "sound_conf"
 
+# Default project root (cwd), looked up once per process
+_DEFAULT_ROOT: Optional[Path] = None
+
+# Parsed sound_conf YAML by path, with the file's mtime at parse time
+_CONF_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _root(project_root: Optional[Path]) -> Path:
+    """Get the project root, defaulting to the cwd captured on first use."""
+    global _DEFAULT_ROOT
+    if project_root is not None:
+        return project_root
+    if _DEFAULT_ROOT is None:
+        _DEFAULT_ROOT = Path.cwd()
+    return _DEFAULT_ROOT
+
+
+def _conf_path(root: Path, conf_name: str) -> Path:
+    """Get the YAML path for a sound_conf name."""
+    return root / SOUND_CONF_DIR / f"{conf_name}.yaml"
+
+
+def _load_conf(yaml_path: Path) -> Dict[str, Any]:
+    """
+    Load a sound_conf YAML file, reusing the parsed result until the file changes.
+
+    Args:
+        yaml_path: Path to the sound_conf YAML file
+
+    Returns:
+        Parsed config dict (shared - do not modify)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    mtime = yaml_path.stat().st_mtime_ns
+    cached = _CONF_CACHE.get(yaml_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(yaml_path, 'r') as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+    _CONF_CACHE[yaml_path] = (mtime, config)
+    return config
+
 
 def is_sound_conf_reference(sound_file: str) -> bool:
     """
@@ -57,28 +113,25 @@ def resolve_sound_conf(sound_ref: str, project_root: Optional[Path] = None) -> O
     # Extract the conf name
     conf_name = sound_ref[len(SOUND_CONF_PREFIX):].strip()
     if not conf_name:
-        print(f"WARNING: Empty sound_conf reference: {sound_ref}")
+        logger.warning("Empty sound_conf reference: %s", sound_ref)
         return None
 
     # Find and load the YAML
-    root = project_root or Path.cwd()
-    yaml_path = root / SOUND_CONF_DIR / f"{conf_name}.yaml"
-
-    if not yaml_path.exists():
-        print(f"WARNING: Sound conf file not found: {yaml_path}")
-        return None
+    yaml_path = _conf_path(_root(project_root), conf_name)
 
     try:
-        with open(yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = _load_conf(yaml_path)
+    except FileNotFoundError:
+        logger.warning("Sound conf file not found: %s", yaml_path)
+        return None
     except Exception as e:
-        print(f"WARNING: Failed to load sound conf {yaml_path}: {e}")
+        logger.warning("Failed to load sound conf %s: %s", yaml_path, e)
         return None
 
     # Get the sounds list
     sounds = config.get("sounds", [])
     if not sounds:
-        print(f"WARNING: No sounds defined in {yaml_path}")
+        logger.warning("No sounds defined in %s", yaml_path)
         return None
 
     # Randomly select one sound
@@ -91,7 +144,7 @@ def resolve_sound_conf(sound_ref: str, project_root: Optional[Path] = None) -> O
     elif "url" in selected:
         sound = selected["url"]
     else:
-        print(f"WARNING: Sound entry has neither 'file' nor 'url': {selected}")
+        logger.warning("Sound entry has neither 'file' nor 'url': %s", selected)
         return None
 
     # Check for optional volume and fadeout properties
@@ -129,15 +182,10 @@ def get_sound_conf_info(sound_ref: str, project_root: Optional[Path] = None) ->
     if not conf_name:
         return None
 
-    root = project_root or Path.cwd()
-    yaml_path = root / SOUND_CONF_DIR / f"{conf_name}.yaml"
-
-    if not yaml_path.exists():
-        return None
+    yaml_path = _conf_path(_root(project_root), conf_name)
 
     try:
-        with open(yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = _load_conf(yaml_path)
 
         return {
             "name": config.get("name", conf_name),
@@ -148,6 +196,14 @@ def get_sound_conf_info(sound_ref: str, project_root: Optional[Path] = None) ->
         return None
 
 
+def _load_conf_or_none(yaml_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a sound_conf YAML file, returning None if it is missing or invalid."""
+    try:
+        return _load_conf(yaml_path)
+    except Exception:
+        return None
+
+
 def list_sound_confs(project_root: Optional[Path] = None) -> List[Dict[str, Any]]:
     """
     List all available sound_conf files.
@@ -158,18 +214,23 @@ def list_sound_confs(project_root: Optional[Path] = None) -> List[Dict[str, Any]
     Returns:
         List of dicts with 'ref', 'name', 'description', 'count' keys
     """
-    root = project_root or Path.cwd()
-    conf_dir = root / SOUND_CONF_DIR
+    conf_dir = _root(project_root) / SOUND_CONF_DIR
 
     if not conf_dir.exists():
         return []
 
+    paths = list(conf_dir.glob("*.yaml"))
+
+    # First load reads the files concurrently; later calls only stat via the cache
+    if len(paths) > 1 and any(path not in _CONF_CACHE for path in paths):
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            configs = list(executor.map(_load_conf_or_none, paths))
+    else:
+        configs = [_load_conf_or_none(path) for path in paths]
+
     result = []
-    for yaml_file in conf_dir.glob("*.yaml"):
+    for yaml_file, config in zip(paths, configs):
         try:
-            with open(yaml_file, 'r') as f:
-                config = yaml.safe_load(f)
-
             conf_name = yaml_file.stem
             result.append({
                 "ref": f"{SOUND_CONF_PREFIX}{conf_name}",
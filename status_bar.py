@@ -8,12 +8,31 @@ Tracks 4 independent statuses:
 - Temporary messages (errors, general status)
 """
 
-from typing import Optional
-from pathlib import Path
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
 from PyQt6.QtWidgets import QWidget, QStatusBar, QHBoxLayout
 from PyQt6.QtCore import pyqtSignal, pyqtSlot, QTimer
 
 
+@dataclass(slots=True)
+class _State:
+    """Display state of ImmersiveStatusBar."""
+
+    sound: Optional[str] = None
+    music: Optional[str] = None
+    music_source: str = "spotify"  # "spotify" or "atmosphere"
+    music_raw: Optional[str] = None  # Raw name for tooltip
+    lights: Optional[str] = None
+    temp_message: Optional[str] = None
+    # Last published status/tooltip, used to skip redundant updates
+    last_status: Optional[str] = None
+    pending_status: Optional[str] = None  # Shown but not yet signalled
+    last_tooltip: Optional[str] = None
+    suspend_depth: int = 0  # > 0 while inside bulk_update()
+
+
 class ImmersiveStatusBar(QWidget):
     """
     Multi-section status bar for Immerse Yourself.
@@ -31,22 +50,33 @@ class ImmersiveStatusBar(QWidget):
     DEFAULT_READY = "Ready - Select an environment to start"
     PREFIX = "Immerse yourself running"
 
+    # Tooltip sections (each ends with a blank line except the last)
+    _SOUND_TMPL = "═══ Sound ═══\n  🔊 {}\n\n"
+    _SOUND_EMPTY = "═══ Sound ═══\n  (not playing)\n\n"
+    _MUSIC_TMPL = "═══ Music ═══\n  🎵 {}\n\n"
+    _MUSIC_EMPTY = "═══ Music ═══\n  (not playing)\n\n"
+    _ATMOSPHERE_TMPL = "═══ Atmosphere ═══\n  🌊 {}\n\n"
+    _ATMOSPHERE_EMPTY = "═══ Atmosphere ═══\n  (not playing)\n\n"
+    _LIGHTS_TMPL = "═══ Lights ═══\n  💡 {}"
+    _LIGHTS_EMPTY = "═══ Lights ═══\n  (not active)"
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # Internal state
-        self._sound: Optional[str] = None
-        self._music: Optional[str] = None
-        self._music_source: str = "spotify"  # "spotify" or "atmosphere"
-        self._music_raw: Optional[str] = None  # Raw name for tooltip
-        self._lights: Optional[str] = None
-        self._temp_message: Optional[str] = None
+        self._s = _State()
 
         # Timer for temporary messages
         self._temp_timer = QTimer(self)
         self._temp_timer.setSingleShot(True)
         self._temp_timer.timeout.connect(self._clear_temp_message)
 
+        # Zero-delay timer that coalesces status_changed emits per event-loop pass
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._flush_status_changed)
+
         # Create the underlying status bar
         self._status_bar = QStatusBar(self)
         self._status_bar.setSizeGripEnabled(True)
@@ -59,26 +89,62 @@ class ImmersiveStatusBar(QWidget):
         # Initial display
         self._update_display()
 
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """
+        Apply several setter/clear calls with a single display update at the end.
+
+        Example:
+            with status_bar.bulk_update():
+                status_bar.clear_sound()
+                status_bar.set_message("Stopped", timeout_ms=3000)
+        """
+        self._s.suspend_depth += 1
+        try:
+            yield
+        finally:
+            self._s.suspend_depth -= 1
+            if self._s.suspend_depth == 0:
+                self._update_display()
+
+    def _publish(self, status: str) -> None:
+        """Show a status message, skipping the repaint/signal if nothing changed."""
+        # Compare against the bar itself - Qt may have replaced it (e.g. status tips)
+        if status != self._status_bar.currentMessage():
+            self._status_bar.showMessage(status)
+        self._s.pending_status = status
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+        self._update_tooltip()
+
+    def _flush_status_changed(self) -> None:
+        """Internal: emit status_changed once for a burst of updates."""
+        status = self._s.pending_status
+        if status is not None and status != self._s.last_status:
+            self._s.last_status = status
+            self.status_changed.emit(status)
+
     def _update_display(self) -> None:
         """Update the status bar display based on current state."""
+        if self._s.suspend_depth:
+            return
+
         # Temporary message takes precedence
-        if self._temp_message:
-            self._status_bar.showMessage(self._temp_message)
-            self.status_changed.emit(self._temp_message)
-            self._update_tooltip()
+        if self._s.temp_message:
+            self._publish(self._s.temp_message)
             return
 
         # Build sections
         sections = []
 
-        if self._sound:
-            sections.append(f"sound: playing {self._sound}")
+        if self._s.sound:
+            sections.append(f"sound: playing {self._s.sound}")
 
-        if self._music:
-            sections.append(f"music: playing {self._music}")
+        if self._s.music:
+            sections.append(f"music: playing {self._s.music}")
 
-        if self._lights:
-            sections.append(f"lights: playing {self._lights}")
+        if self._s.lights:
+            sections.append(f"lights: playing {self._s.lights}")
 
         # Compose final message
         if sections:
@@ -86,58 +152,50 @@ class ImmersiveStatusBar(QWidget):
         else:
             status = self.DEFAULT_READY
 
-        self._status_bar.showMessage(status)
-        self.status_changed.emit(status)
-        self._update_tooltip()
+        self._publish(status)
 
     def _update_tooltip(self) -> None:
         """Update the tooltip with detailed multi-line status information."""
-        lines = []
-
         # Sound section
-        lines.append("═══ Sound ═══")
-        if self._sound:
-            lines.append(f"  🔊 {self._sound}")
+        if self._s.sound:
+            sound_part = self._SOUND_TMPL.format(self._s.sound)
         else:
-            lines.append("  (not playing)")
-        lines.append("")
+            sound_part = self._SOUND_EMPTY
 
         # Music/Atmosphere section
-        if self._music_source == "atmosphere":
-            lines.append("═══ Atmosphere ═══")
-            if self._music_raw:
+        if self._s.music_source == "atmosphere":
+            if self._s.music_raw:
                 # Split by " + " to show each sound on its own line
-                sounds = self._music_raw.split(" + ")
-                for sound in sounds:
-                    lines.append(f"  🌊 {sound}")
+                sounds = "\n  🌊 ".join(self._s.music_raw.split(" + "))
+                music_part = self._ATMOSPHERE_TMPL.format(sounds)
             else:
-                lines.append("  (not playing)")
+                music_part = self._ATMOSPHERE_EMPTY
         else:
-            lines.append("═══ Music ═══")
-            if self._music_raw:
-                lines.append(f"  🎵 {self._music_raw}")
+            if self._s.music_raw:
+                music_part = self._MUSIC_TMPL.format(self._s.music_raw)
             else:
-                lines.append("  (not playing)")
-        lines.append("")
+                music_part = self._MUSIC_EMPTY
 
         # Lights section
-        lines.append("═══ Lights ═══")
-        if self._lights:
-            lines.append(f"  💡 {self._lights}")
+        if self._s.lights:
+            lights_part = self._LIGHTS_TMPL.format(self._s.lights)
         else:
-            lines.append("  (not active)")
+            lights_part = self._LIGHTS_EMPTY
 
-        self._status_bar.setToolTip("\n".join(lines))
+        tooltip = sound_part + music_part + lights_part
+        if tooltip != self._s.last_tooltip:
+            self._s.last_tooltip = tooltip
+            self._status_bar.setToolTip(tooltip)
 
     # --- Setters ---
 
     def set_sound(self, sound_file: Optional[str]) -> None:
         """Set current sound status. Pass None or empty string to clear."""
-        if sound_file:
-            # Extract just filename from path
-            self._sound = Path(sound_file).name
-        else:
-            self._sound = None
+        # Extract just filename from path
+        sound = os.path.basename(sound_file) if sound_file else None
+        if sound == self._s.sound:
+            return
+        self._s.sound = sound
         self._update_display()
 
     def set_music(self, name: Optional[str], source: str = "spotify") -> None:
@@ -148,20 +206,25 @@ class ImmersiveStatusBar(QWidget):
             name: Playlist name or sound names (joined with " + " for atmosphere)
             source: "spotify" or "atmosphere" - affects display prefix
         """
-        self._music_source = source
-        self._music_raw = name
+        if (source, name) == (self._s.music_source, self._s.music_raw):
+            return
+        self._s.music_source = source
+        self._s.music_raw = name
         if name:
             if source == "atmosphere":
-                self._music = f"Atmosphere: {name}"
+                self._s.music = f"Atmosphere: {name}"
             else:
-                self._music = f"Spotify: {name}"
+                self._s.music = f"Spotify: {name}"
         else:
-            self._music = None
+            self._s.music = None
         self._update_display()
 
     def set_lights(self, animation_name: Optional[str]) -> None:
         """Set current lights status. Pass None to clear."""
-        self._lights = animation_name if animation_name else None
+        lights = animation_name if animation_name else None
+        if lights == self._s.lights:
+            return
+        self._s.lights = lights
         self._update_display()
 
     def set_message(self, message: Optional[str], timeout_ms: int = 0) -> None:
@@ -172,8 +235,12 @@ class ImmersiveStatusBar(QWidget):
             message: Message to display, or None to clear
             timeout_ms: Auto-clear after this many milliseconds (0 = no timeout)
         """
+        # Clearing an already-clear message is a no-op
+        if not message and self._s.temp_message is None and not self._temp_timer.isActive():
+            return
+
         self._temp_timer.stop()
-        self._temp_message = message
+        self._s.temp_message = message
 
         if message and timeout_ms > 0:
             self._temp_timer.start(timeout_ms)
@@ -184,58 +251,66 @@ class ImmersiveStatusBar(QWidget):
 
     def clear_sound(self) -> None:
         """Clear sound status."""
-        self._sound = None
+        if self._s.sound is None:
+            return
+        self._s.sound = None
         self._update_display()
 
     def clear_music(self) -> None:
         """Clear music status."""
-        self._music = None
-        self._music_raw = None
+        if self._s.music is None and self._s.music_raw is None:
+            return
+        self._s.music = None
+        self._s.music_raw = None
         self._update_display()
 
     def clear_lights(self) -> None:
         """Clear lights status."""
-        self._lights = None
+        if self._s.lights is None:
+            return
+        self._s.lights = None
         self._update_display()
 
     def clear_message(self) -> None:
         """Clear temporary message."""
         self._temp_timer.stop()
-        self._temp_message = None
+        if self._s.temp_message is None:
+            return
+        self._s.temp_message = None
         self._update_display()
 
     def clear_all(self) -> None:
         """Clear all statuses."""
         self._temp_timer.stop()
-        self._sound = None
-        self._music = None
-        self._music_raw = None
-        self._lights = None
-        self._temp_message = None
+        self._s.sound = None
+        self._s.music = None
+        self._s.music_raw = None
+        self._s.lights = None
+        self._s.temp_message = None
         self._update_display()
 
     def _clear_temp_message(self) -> None:
         """Internal: clear temp message when timer fires."""
-        self._temp_message = None
+        self._s.temp_message = None
         self._update_display()
 
     # --- Getters ---
 
     def get_sound(self) -> Optional[str]:
         """Get current sound status."""
-        return self._sound
+        return self._s.sound
 
     def get_music(self) -> Optional[str]:
         """Get current music status."""
-        return self._music
+        return self._s.music
 
     def get_lights(self) -> Optional[str]:
         """Get current lights status."""
-        return self._lights
+        return self._s.lights
 
     def is_active(self) -> bool:
         """Check if any environment is currently running."""
-        return bool(self._sound or self._music or self._lights)
+        return bool(self._s.sound or self._s.music or self._s.lights)
 
     # --- Slots for signal connection ---
 
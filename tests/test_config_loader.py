@@ -10,10 +10,14 @@ from pathlib import Path
 from config_loader import ConfigLoader, ConfigValidationError
 
 
-def test_config_loader_loads_valid_config():
-    """Test that valid YAML configs load successfully."""
-    loader = ConfigLoader("env_conf")
+@pytest.fixture(scope="module")
+def loader():
+    """Shared ConfigLoader for the env_conf directory."""
+    return ConfigLoader("env_conf")
+
 
+def test_config_loader_loads_valid_config(loader):
+    """Test that valid YAML configs load successfully."""
     # Load tavern config (should exist)
     config = loader.load("tavern.yaml")
 
@@ -24,19 +28,17 @@ def test_config_loader_loads_valid_config():
     assert "engines" in config
 
 
-def test_config_loader_validates_required_fields():
+def test_config_loader_validates_required_fields(loader):
     """Test that configs with missing required fields are rejected."""
     # This test would need a fixture file with missing fields
     # For now, testing the validation logic is present
-    loader = ConfigLoader("env_conf")
-
     # The loader should validate configs when loading
     assert hasattr(loader, "_validate_config")
 
 
-def test_config_loader_caching():
+def test_config_loader_caching(loader):
     """Test that config caching works."""
-    loader = ConfigLoader("env_conf")
+    loader.clear_cache()
 
     # Load config twice
     config1 = loader.load("tavern.yaml")
@@ -46,9 +48,9 @@ def test_config_loader_caching():
     assert config1 is config2
 
 
-def test_config_loader_cache_bypass():
+def test_config_loader_cache_bypass(loader):
     """Test that cache can be bypassed."""
-    loader = ConfigLoader("env_conf")
+    loader.clear_cache()
 
     # Load with cache
     config1 = loader.load("tavern.yaml", use_cache=True)
@@ -63,10 +65,8 @@ def test_config_loader_cache_bypass():
     assert config1 == config2
 
 
-def test_config_loader_discover_all():
+def test_config_loader_discover_all(loader):
     """Test that all configs can be discovered."""
-    loader = ConfigLoader("env_conf")
-
     configs = loader.discover_all()
 
     # Should find at least the 5 example configs we created
@@ -79,10 +79,30 @@ def test_config_loader_discover_all():
         assert "engines" in config
 
 
-def test_config_loader_category_filter():
-    """Test filtering configs by category."""
-    loader = ConfigLoader("env_conf")
+def test_config_loader_discover_all_picks_up_new_files(tmp_path):
+    """Test that the cached directory listing is refreshed when files change."""
+    source = Path("env_conf") / "tavern.yaml"
+    (tmp_path / "tavern.yaml").write_text(source.read_text())
+    loader = ConfigLoader(str(tmp_path))
+
+    assert len(loader.discover_all()) == 1
 
+    (tmp_path / "tavern_copy.yml").write_text(source.read_text())
+    assert len(loader.discover_all()) == 2
+
+
+def test_config_loader_discover_all_includes_dotfiles(tmp_path):
+    """Test that dot-prefixed config files are discovered, as with glob."""
+    source = Path("env_conf") / "tavern.yaml"
+    (tmp_path / "tavern.yaml").write_text(source.read_text())
+    (tmp_path / ".tavern_hidden.yaml").write_text(source.read_text())
+    loader = ConfigLoader(str(tmp_path))
+
+    assert len(loader.discover_all()) == 2
+
+
+def test_config_loader_category_filter(loader):
+    """Test filtering configs by category."""
     social_configs = loader.get_by_category("social")
 
     # Should find tavern.yaml
@@ -99,17 +119,18 @@ def test_config_loader_invalid_directory():
         ConfigLoader("nonexistent_directory")
 
 
-def test_config_loader_missing_file():
+@pytest.mark.parametrize(
+    "filename", ["nonexistent_environment.yaml", "nonexistent_environment.yml"]
+)
+def test_config_loader_missing_file(loader, filename):
     """Test that loading missing file raises error."""
-    loader = ConfigLoader("env_conf")
-
     with pytest.raises(FileNotFoundError):
-        loader.load("nonexistent_environment.yaml")
+        loader.load(filename)
 
 
-def test_config_clear_cache():
+def test_config_clear_cache(loader):
     """Test cache clearing."""
-    loader = ConfigLoader("env_conf")
+    loader.clear_cache()
 
     # Load and cache
     loader.load("tavern.yaml")
@@ -120,10 +141,8 @@ def test_config_clear_cache():
     assert len(loader._cache) == 0
 
 
-def test_config_reload():
+def test_config_reload(loader):
     """Test config reload bypasses cache."""
-    loader = ConfigLoader("env_conf")
-
     # Load and cache
     config1 = loader.load("tavern.yaml")
 
@@ -0,0 +1,56 @@
+"""
+Tests for sound_conf_resolver
+
+These tests verify sound_conf resolution and that parsed YAML files are
+reused until they change on disk.
+"""
+
+import os
+from pathlib import Path
+from sound_conf_resolver import (
+    is_sound_conf_reference, resolve_sound_conf, get_sound_conf_info, list_sound_confs,
+)
+
+
+def _write_conf(root: Path, name: str, body: str) -> Path:
+    conf_dir = root / "sound_conf"
+    conf_dir.mkdir(exist_ok=True)
+    path = conf_dir / f"{name}.yaml"
+    path.write_text(body)
+    return path
+
+
+def test_is_sound_conf_reference():
+    """Test detection of sound_conf references."""
+    assert is_sound_conf_reference("sound_conf:squeaky_door")
+    assert not is_sound_conf_reference("sounds/door.wav")
+    assert not is_sound_conf_reference("")
+
+
+def test_resolve_sound_conf_with_properties(tmp_path):
+    """Test that volume/fadeout properties produce a dict result."""
+    _write_conf(tmp_path, "door", "sounds:\n  - file: door.wav\n    volume: 50\n")
+
+    result = resolve_sound_conf("sound_conf:door", tmp_path)
+
+    assert result == {"sound": "door.wav", "volume": 50}
+
+
+def test_resolve_sound_conf_missing_file(tmp_path):
+    """Test that a missing sound_conf resolves to None."""
+    assert resolve_sound_conf("sound_conf:nope", tmp_path) is None
+    assert get_sound_conf_info("sound_conf:nope", tmp_path) is None
+
+
+def test_sound_conf_reloaded_after_change(tmp_path):
+    """Test that cached parses are dropped when the file is modified."""
+    path = _write_conf(tmp_path, "door", "name: Door\nsounds:\n  - file: a.wav\n")
+    assert get_sound_conf_info("sound_conf:door", tmp_path)["count"] == 1
+
+    path.write_text("name: Door\nsounds:\n  - file: a.wav\n  - file: b.wav\n")
+    # Make sure the mtime differs even on coarse-grained filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert get_sound_conf_info("sound_conf:door", tmp_path)["count"] == 2
+    assert list_sound_confs(tmp_path)[0]["count"] == 2
@@ -10,100 +10,196 @@ Usage:
 
 import sys
 import re
-import urllib.request
 import urllib.parse
-from html import unescape
+from itertools import islice
+from html.parser import HTMLParser
+from typing import Iterator
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def search_freesound(keywords: str, max_results: int = 10) -> list:
-    """
-    Search freesound.org for sounds matching keywords.
+# Sound links: /people/USER/sounds/ID/
+SOUND_HREF_RE = re.compile(r'/people/([^"]+)/sounds/(\d+)/', re.ASCII | re.IGNORECASE)
 
-    Args:
-        keywords: Search terms (e.g., "outdoor crowd ambience")
-        max_results: Maximum number of results to return
+# Tags: /browse/tags/TAGNAME/
+TAG_HREF_RE = re.compile(r'/browse/tags/([^"/]+)/', re.ASCII | re.IGNORECASE)
 
-    Returns:
-        List of dicts with url, title, description, tags, duration
-    """
-    # Build search URL
-    query = urllib.parse.quote_plus(keywords)
-    url = f"https://freesound.org/search/?q={query}"
+# Tags kept per result
+MAX_TAGS = 10
 
-    # Fetch the page
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
-    req = urllib.request.Request(url, headers=headers)
+# Bytes read from the response per parser feed
+PARSE_CHUNK = 16384
 
-    try:
-        with urllib.request.urlopen(req, timeout=15) as response:
-            html = response.read().decode('utf-8')
-    except Exception as e:
-        print(f"Error fetching search results: {e}", file=sys.stderr)
-        return []
+# Link texts that point at a sound page but are not its title
+NAV_TITLES = ('Download', 'Edit', 'Delete', 'Similar sounds')
 
-    results = []
-    seen_urls = set()
+# Shared session: keep-alive connections to freesound.org and gzip transfers
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
 
-    # Find all sound links: /people/USER/sounds/ID/
-    sound_pattern = re.compile(
-        r'<a[^>]+href="(/people/([^"]+)/sounds/(\d+)/)"[^>]*>([^<]+)</a>',
-        re.IGNORECASE
-    )
 
-    # Find all tags: /browse/tags/TAGNAME/
-    tag_pattern = re.compile(r'href="/browse/tags/([^"/]+)/"', re.IGNORECASE)
+class _SearchPageParser(HTMLParser):
+    """
+    Single-pass extractor for a freesound.org search results page.
 
-    # Process HTML in chunks around each sound link
-    for match in sound_pattern.finditer(html):
-        href, user, sound_id, title = match.groups()
-        full_url = f'https://freesound.org{href}'
+    Every sound link starts a new result. The first text after the element
+    that closes around the link becomes its description, and tag links seen
+    before the next sound link are attributed to it. A result is finished
+    once the next one starts (or the page ends) and is then handed out by
+    pop_finished().
+    """
 
-        # Skip duplicates
-        if full_url in seen_urls:
-            continue
-        seen_urls.add(full_url)
+    def __init__(self):
+        super().__init__()
+        self.results = {}  # full_url -> result, in page order
+        self._current = None  # Result that description/tags attach to
+        self._link = None  # (href, user, id) of the open sound <a>
+        self._title_parts = []
+        self._desc_state = None  # None, "after_link", "after_close" or "in_desc"
+        self._desc_parts = []
+        self._finished = []  # Completed results not yet popped
+
+    def pop_finished(self):
+        """Return results that can no longer change, in page order."""
+        finished = self._finished
+        self._finished = []
+        return finished
+
+    def close(self):
+        super().close()
+        self._finish_description()
+        if self._current is not None:
+            self._finished.append(self._current)
+            self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        # Description text must directly follow the link's container
+        self._finish_description()
+        self._desc_state = None
+        if tag != 'a':
+            return
+
+        href = dict(attrs).get('href') or ''
+        sound_match = SOUND_HREF_RE.fullmatch(href)
+        if sound_match:
+            self._link = (href,) + sound_match.groups()
+            self._title_parts = []
+            return
+
+        tag_match = TAG_HREF_RE.fullmatch(href)
+        if tag_match and self._current is not None:
+            # Tags repeat across a result's card; keep first-seen order, capped
+            tags = self._current['tags']
+            name = tag_match.group(1)
+            if len(tags) < MAX_TAGS and name not in tags:
+                tags.append(name)
+
+    def handle_endtag(self, tag):
+        self._finish_description()
+        if tag == 'a' and self._link is not None:
+            self._finish_sound_link()
+        elif self._desc_state == 'after_link':
+            self._desc_state = 'after_close'
+        else:
+            self._desc_state = None
+
+    def handle_data(self, data):
+        if self._link is not None:
+            self._title_parts.append(data)
+        elif self._desc_state == 'in_desc':
+            # Text can arrive in several pieces when the page is fed in chunks
+            self._desc_parts.append(data)
+        elif self._desc_state is not None and data.strip():
+            if self._desc_state == 'after_close':
+                self._desc_parts = [data]
+                self._desc_state = 'in_desc'
+            else:
+                self._desc_state = None
+
+    def _finish_description(self):
+        """Store the description text collected since the last tag, if any."""
+        if self._desc_state == 'in_desc':
+            self._current['description'] = ''.join(self._desc_parts).strip()[:200]
+            self._desc_state = None
+            self._desc_parts = []
+
+    def _finish_sound_link(self):
+        """Turn the just-closed sound link into a result."""
+        href, user, sound_id = self._link
+        title = ''.join(self._title_parts).strip()
+        self._link = None
 
-        # Clean up title
-        title = unescape(title.strip())
+        # Skip duplicates
+        full_url = f'https://freesound.org{href}'
+        if full_url in self.results:
+            return
 
         # Skip navigation/non-sound links
-        if not title or title in ['Download', 'Edit', 'Delete', 'Similar sounds']:
-            continue
-
-        # Get context around this match to find tags
-        start = max(0, match.start() - 500)
-        end = min(len(html), match.end() + 2000)
-        context = html[start:end]
-
-        # Extract tags from context
-        tags = list(set(tag_pattern.findall(context)))[:10]
-
-        # Try to find description - look for text after the title
-        desc = ""
-        desc_match = re.search(
-            rf'{re.escape(title)}</a>\s*</[^>]+>\s*([^<]+)',
-            context,
-            re.IGNORECASE
-        )
-        if desc_match:
-            desc = unescape(desc_match.group(1).strip())
-
-        results.append({
+        if not title or title in NAV_TITLES:
+            return
+
+        if self._current is not None:
+            self._finished.append(self._current)
+        self._current = {
             'user': user,
             'id': sound_id,
             'url': full_url,
             'title': title,
-            'description': desc[:200] if desc else '',
-            'tags': tags,
+            'description': '',
+            'tags': [],
             'duration': ''
-        })
+        }
+        self.results[full_url] = self._current
+        self._desc_state = 'after_link'
+
+
+def search_freesound(keywords: str) -> Iterator[dict]:
+    """
+    Search freesound.org for sounds matching keywords.
 
-        if len(results) >= max_results:
-            break
+    Results are produced lazily while the page downloads; take as many as
+    needed with itertools.islice and the rest is never fetched or parsed.
 
-    return results
+    Args:
+        keywords: Search terms (e.g., "outdoor crowd ambience")
+
+    Yields:
+        Dicts with url, title, description, tags, duration
+    """
+    # Build search URL
+    query = urllib.parse.quote_plus(keywords)
+    url = f"https://freesound.org/search/?q={query}"
+
+    # Fetch the page
+    try:
+        response = _SESSION.get(url, stream=True, timeout=15)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"Error fetching search results: {e}", file=sys.stderr)
+        return
+
+    # Parse the page as it arrives rather than buffering all of it first
+    parser = _SearchPageParser()
+    with response:
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+        try:
+            for chunk in response.iter_content(chunk_size=PARSE_CHUNK, decode_unicode=True):
+                parser.feed(chunk)
+                yield from parser.pop_finished()
+        except requests.RequestException as e:
+            print(f"Error reading search results: {e}", file=sys.stderr)
+    parser.close()
+    yield from parser.pop_finished()
 
 
 def format_results(results: list) -> str:
@@ -138,10 +234,8 @@ def format_yaml(results: list) -> str:
         comment = r['title']
         if r['duration']:
             comment += f" ({r['duration']})"
-        output.append(f"      # {comment}")
-        output.append(f"      - url: \"{r['url']}\"")
-        output.append(f"        volume: 50")
-        output.append("")
+        # One block per sound; its trailing newline leaves a blank line after the join
+        output.append(f"      # {comment}\n      - url: \"{r['url']}\"\n        volume: 50\n")
 
     return '\n'.join(output)
 
@@ -155,7 +249,7 @@ if __name__ == '__main__':
     print(f"Searching freesound.org for: {keywords}")
     print(f"Search URL: https://freesound.org/search/?q={urllib.parse.quote_plus(keywords)}")
 
-    results = search_freesound(keywords, max_results=10)
+    results = list(islice(search_freesound(keywords), 10))
 
     print(format_results(results))
     print("\n" + "="*60)